@@ -8,15 +8,22 @@ sequential and parallel processing modes.
 
 import os
 import sys
+import ast
 import json
 import logging
 import argparse
 from utils.logging_config import configure_logging
 import traceback
-import multiprocessing
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+    USING_ORJSON = True
+except ImportError:
+    USING_ORJSON = False
 
 from core.types import (
     DocumentType,
@@ -25,13 +32,120 @@ from core.types import (
     WorkflowStatus,
     WorkflowConfig
 )
-from workflow.standard import StandardWorkflow
-from workflow.parallel import ParallelWorkflow
-from utils.validation import JP2Validator
 
 # Setup logger
 logger = logging.getLogger("jp2forge")
 
+# Argument choices derived from the enums, computed once at import
+DOCUMENT_TYPE_CHOICES = tuple(dt.name.lower() for dt in DocumentType)
+COMPRESSION_MODE_CHOICES = tuple(mode.value for mode in CompressionMode)
+LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+@lru_cache(maxsize=None)
+def _read_source_version() -> Optional[str]:
+    """Read __version__ from the project's top-level __init__.py.
+
+    Used when JP2Forge runs from a source checkout rather than an installed
+    distribution. The file is parsed once with ast instead of being
+    line-scanned, so formatting of the assignment does not matter.
+
+    Returns:
+        Optional[str]: Version string, or None if it cannot be determined
+    """
+    init_path = Path(__file__).resolve().parent.parent / "__init__.py"
+    try:
+        tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return None
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__version__"
+                for target in node.targets):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                return node.value.value
+    return None
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize a report object to indented JSON bytes.
+
+    Uses orjson when it is installed (much faster for large jpylyzer
+    reports) and the standard library otherwise.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON with two-space indentation
+    """
+    if USING_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects non-str keys and integers wider than 64 bits,
+            # which the standard library serializes fine
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _load_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Parsed object
+    """
+    if USING_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Reports written by the stdlib fallback in _dump_json may
+            # contain NaN/Infinity, which orjson does not accept
+            pass
+    return json.loads(data)
+
+
+def _file_size(path: Optional[str]) -> Optional[int]:
+    """Return the size of a file in bytes with a single stat call.
+
+    Args:
+        path: File path (may be empty or None)
+
+    Returns:
+        Optional[int]: Size in bytes, or None if the file does not exist
+    """
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line value that must be an integer of at least 1.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        int: Parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def create_workflow(config: WorkflowConfig):
     """Create the appropriate workflow based on configuration.
@@ -42,48 +156,152 @@ def create_workflow(config: WorkflowConfig):
     Returns:
         Workflow instance
     """
+    # Workflow modules pull in NumPy, Pillow and the process pools; import
+    # them only once a workflow is actually needed (not for --version/--help)
     if config.processing_mode == ProcessingMode.PARALLEL:
+        from workflow.parallel import ParallelWorkflow
         return ParallelWorkflow(config)
     else:
+        from workflow.standard import StandardWorkflow
         return StandardWorkflow(config)
 
 
-def validate_output_with_jpylyzer(output_dir, report_dir):
+# Per-process validator used by _validate_jp2_worker; created once in each
+# worker by _init_validation_worker so tool detection is not repeated per file
+_worker_validator = None
+
+
+def _init_validation_worker():
+    """Create the JP2Validator for a validation worker process."""
+    from utils.validation import JP2Validator
+
+    global _worker_validator
+    _worker_validator = JP2Validator()
+
+
+def _validate_jp2_worker(jp2_file):
+    """Validate a single JP2 file in a worker process.
+
+    Args:
+        jp2_file: Path to the JP2 file
+
+    Returns:
+        dict: JP2Validator result for the file
+    """
+    return _worker_validator.validate_jp2(jp2_file)
+
+
+def validate_output_with_jpylyzer(output_dir, report_dir, max_workers=None):
     """
     Validate all JP2 files in output_dir using JPylyzer and write a single JSON report to report_dir.
+
+    Files are validated in parallel worker processes when there is more than
+    one; a single file is validated in-process.
+
+    Args:
+        output_dir: Directory containing the JP2 files
+        report_dir: Directory for the info_jpylyzer.json report
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        dict: JP2 file name -> jpylyzer isValid flag, for the summary report
     """
-    validator = JP2Validator()
-    output_path = Path(output_dir)
     report_path = Path(report_dir)
     report_path.mkdir(exist_ok=True, parents=True)
 
-    all_results = {}
-    for jp2_file in output_path.glob("*.jp2"):
-        result = validator.validate_jp2(str(jp2_file))
-        all_results[jp2_file.name] = result
+    # One directory read; DirEntry name/path avoid building Path objects
+    try:
+        with os.scandir(output_dir) as entries:
+            jp2_entries = [
+                entry for entry in entries
+                if entry.name.endswith(".jp2") and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        jp2_entries = []
+    names = [entry.name for entry in jp2_entries]
+    paths = [entry.path for entry in jp2_entries]
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+
+    if not paths:
+        # Nothing to validate (e.g. every conversion failed): skip tool
+        # detection entirely, but still write an empty report so the
+        # summary report can be generated
+        logger.info("No JP2 outputs found; skipping JPylyzer validation")
+        all_results = {}
+    elif workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_validation_worker
+        ) as executor:
+            # map() yields results in input order, so the report keeps the
+            # directory listing order regardless of completion order
+            all_results = dict(zip(
+                names,
+                executor.map(_validate_jp2_worker, paths, chunksize=chunksize)
+            ))
+    else:
+        from utils.validation import JP2Validator
+
+        validator = JP2Validator()
+        all_results = dict(zip(names, map(validator.validate_jp2, paths)))
     # Write a single JSON file with all results
     summary_file = report_path / "info_jpylyzer.json"
-    with open(summary_file, "w") as f:
-        json.dump(all_results, f, indent=2)
+    # Encode once and write once; json.dump issues a write per token
+    report_json = _dump_json(all_results)
+    with open(summary_file, "wb") as f:
+        f.write(report_json)
+
+    return _validity_map(all_results)
+
+
+def _validity_map(jpylyzer_data):
+    """Reduce jpylyzer results to the per-file isValid flags.
+
+    Args:
+        jpylyzer_data: JP2 file name -> validation result
 
+    Returns:
+        dict: JP2 file name -> isValid flag (None if not reported)
+    """
+    return {
+        name: result.get('isValid') if isinstance(result, dict) else None
+        for name, result in jpylyzer_data.items()
+    }
 
-def generate_summary_report_with_jpylyzer(results, config, report_dir, full_report=False):
+
+def generate_summary_report_with_jpylyzer(results, config, report_dir, full_report=False, validity=None):
     """
     Generate summary_report.md using only info_jpylyzer.json for validation status.
+
+    Args:
+        results: Processing results
+        config: Workflow configuration as a dictionary
+        report_dir: Directory containing info_jpylyzer.json
+        full_report: Whether to include detailed per-file metrics
+        validity: Optional JP2 file name -> isValid map as returned by
+            validate_output_with_jpylyzer; avoids re-reading the JSON report
     """
-    info_jpylyzer_path = Path(report_dir) / "info_jpylyzer.json"
-    if not info_jpylyzer_path.exists():
-        logger.warning("info_jpylyzer.json not found, skipping summary report generation.")
-        return
-    with open(info_jpylyzer_path, "r") as f:
-        jpylyzer_data = json.load(f)
-
-    # Calculate statistics if they aren't already present
-    total_files = len(results.get('processed_files', []))
+    if validity is None:
+        info_jpylyzer_path = Path(report_dir) / "info_jpylyzer.json"
+        if not info_jpylyzer_path.exists():
+            logger.warning("info_jpylyzer.json not found, skipping summary report generation.")
+            return
+        # Keep only the flags the report needs, not the full result trees
+        with open(info_jpylyzer_path, "rb") as f:
+            validity = _validity_map(_load_json(f.read()))
+
+    # Calculate statistics if they aren't already present. The header is
+    # streamed before the per-file details, so the list is only walked
+    # here when the workflow did not already provide a success count.
+    processed_files = results.get('processed_files', [])
+    total_files = len(processed_files)
     success_count = results.get('success_count', 0)
     if 'success_count' not in results:
         # Calculate successful files if not provided
-        success_count = sum(1 for file in results.get('processed_files', [])
+        success_count = sum(1 for file in processed_files
                             if file.get('status') == 'SUCCESS')
         results['success_count'] = success_count
 
@@ -96,90 +314,95 @@ def generate_summary_report_with_jpylyzer(results, config, report_dir, full_repo
     if hasattr(overall_status, 'name'):
         overall_status = overall_status.name
 
-    summary_lines = []
-    summary_lines.append("# JPEG2000 Conversion Summary Report")
-    summary_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    summary_lines.append("## Overall Statistics\n-----------------")
-    summary_lines.append(f"Total Files: {total_files}")
-    summary_lines.append(f"Successful: {success_count}")
-    summary_lines.append(f"Warnings: {warning_count}")
-    summary_lines.append(f"Errors: {error_count}")
-    summary_lines.append(f"Corrupted: {corrupted_count}")
-    summary_lines.append(f"Overall Status: {overall_status}")
-
-    if results.get('processing_time', 0) > 0:
-        summary_lines.append(f"Total Processing Time: {results['processing_time']:.2f} seconds")
-        if total_files > 0:
-            summary_lines.append(
-                f"Average Processing Rate: {total_files / results['processing_time']:.2f} files/second\n")
-
-    summary_lines.append("## Configuration\n-----------------")
-    for key, value in config.items():
-        summary_lines.append(f"{key}: {value}")
-    summary_lines.append("")
-    summary_lines.append("## Detailed Results\n----------------")
-
-    for file_result in results.get('processed_files', []):
-        input_file = file_result.get('input_file', 'Unknown')
-        status = file_result.get('status', 'UNKNOWN')
-        output_file = file_result.get('output_file', '')
-        file_sizes = file_result.get('file_sizes') or {}
-        orig_size = file_sizes.get('original_size_human', 'N/A')
-        conv_size = file_sizes.get('converted_size_human', 'N/A')
-        ratio = file_sizes.get('compression_ratio', 'N/A')
-        jp2_name = Path(output_file).name if output_file else ''
-        is_valid = jpylyzer_data.get(jp2_name, {}).get('isValid', None)
-
-        summary_lines.append(f"File: {input_file}")
-        summary_lines.append(f"Status: {status}")
-        summary_lines.append(f"Output: {output_file}")
-        summary_lines.append(f"Original Size: {orig_size}")
-        summary_lines.append(f"Converted Size: {conv_size}")
-        summary_lines.append(f"Compression Ratio: {ratio}")
-        summary_lines.append(f"Jpylyzer Validation: {is_valid}")
+    summary_path = Path(report_dir) / "summary_report.md"
+    # Stream the report to disk instead of collecting every line in a list
+    # and joining it; lines are newline-separated (no trailing newline)
+    with open(summary_path, "w", buffering=1 << 16) as f:
+        f.write("# JPEG2000 Conversion Summary Report")
+
+        def emit(line):
+            f.write("\n")
+            f.write(line)
+
+        emit(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        emit("## Overall Statistics\n-----------------")
+        emit(f"Total Files: {total_files}")
+        emit(f"Successful: {success_count}")
+        emit(f"Warnings: {warning_count}")
+        emit(f"Errors: {error_count}")
+        emit(f"Corrupted: {corrupted_count}")
+        emit(f"Overall Status: {overall_status}")
+
+        if results.get('processing_time', 0) > 0:
+            emit(f"Total Processing Time: {results['processing_time']:.2f} seconds")
+            if total_files > 0:
+                emit(
+                    f"Average Processing Rate: {total_files / results['processing_time']:.2f} files/second\n")
+
+        emit("## Configuration\n-----------------")
+        for key, value in config.items():
+            emit(f"{key}: {value}")
+        emit("")
+        emit("## Detailed Results\n----------------")
+
+        for file_result in processed_files:
+            input_file = file_result.get('input_file', 'Unknown')
+            status = file_result.get('status', 'UNKNOWN')
+            output_file = file_result.get('output_file', '')
+            file_sizes = file_result.get('file_sizes') or {}
+            orig_size = file_sizes.get('original_size_human', 'N/A')
+            conv_size = file_sizes.get('converted_size_human', 'N/A')
+            ratio = file_sizes.get('compression_ratio', 'N/A')
+            jp2_name = Path(output_file).name if output_file else ''
+            is_valid = validity.get(jp2_name)
+
+            emit(f"File: {input_file}")
+            emit(f"Status: {status}")
+            emit(f"Output: {output_file}")
+            emit(f"Original Size: {orig_size}")
+            emit(f"Converted Size: {conv_size}")
+            emit(f"Compression Ratio: {ratio}")
+            emit(f"Jpylyzer Validation: {is_valid}")
         
-        # Add detailed metrics for full report mode
-        if full_report:
-            metrics = file_result.get('metrics', {})
-            if metrics:
-                summary_lines.append(f"PSNR: {metrics.get('psnr', 'N/A')} dB")
-                summary_lines.append(f"SSIM: {metrics.get('ssim', 'N/A')}")
-                summary_lines.append(f"MSE: {metrics.get('mse', 'N/A')}")
-                summary_lines.append(f"Quality Passed: {metrics.get('quality_passed', 'N/A')}")
+            # Add detailed metrics for full report mode
+            if full_report:
+                metrics = file_result.get('metrics', {})
+                if metrics:
+                    emit(f"PSNR: {metrics.get('psnr', 'N/A')} dB")
+                    emit(f"SSIM: {metrics.get('ssim', 'N/A')}")
+                    emit(f"MSE: {metrics.get('mse', 'N/A')}")
+                    emit(f"Quality Passed: {metrics.get('quality_passed', 'N/A')}")
             
-            # Add processing timing information
-            processing_time = file_result.get('processing_time', 0)
-            if processing_time > 0:
-                summary_lines.append(f"Processing Time: {processing_time:.2f} seconds")
+                # Add processing timing information
+                processing_time = file_result.get('processing_time', 0)
+                if processing_time > 0:
+                    emit(f"Processing Time: {processing_time:.2f} seconds")
                 
-                # Calculate throughput
-                if file_sizes.get('original_size_bytes'):
-                    throughput_mb_s = (file_sizes['original_size_bytes'] / (1024 * 1024)) / processing_time
-                    summary_lines.append(f"Throughput: {throughput_mb_s:.2f} MB/s")
+                    # Calculate throughput
+                    if file_sizes.get('original_size_bytes'):
+                        throughput_mb_s = (file_sizes['original_size_bytes'] / (1024 * 1024)) / processing_time
+                        emit(f"Throughput: {throughput_mb_s:.2f} MB/s")
             
-            # Add memory usage if available
-            memory_usage = file_result.get('peak_memory_mb', 0)
-            if memory_usage > 0:
-                summary_lines.append(f"Peak Memory Usage: {memory_usage:.1f} MB")
+                # Add memory usage if available
+                memory_usage = file_result.get('peak_memory_mb', 0)
+                if memory_usage > 0:
+                    emit(f"Peak Memory Usage: {memory_usage:.1f} MB")
                 
-            # Add BnF specific information
-            if config.get('bnf_compliant', False):
-                target_ratio = file_result.get('target_compression_ratio', 'N/A')
-                actual_ratio = ratio if ratio != 'N/A' else 'N/A'
-                summary_lines.append(f"BnF Target Ratio: {target_ratio}")
-                summary_lines.append(f"BnF Actual Ratio: {actual_ratio}")
+                # Add BnF specific information
+                if config.get('bnf_compliant', False):
+                    target_ratio = file_result.get('target_compression_ratio', 'N/A')
+                    actual_ratio = ratio if ratio != 'N/A' else 'N/A'
+                    emit(f"BnF Target Ratio: {target_ratio}")
+                    emit(f"BnF Actual Ratio: {actual_ratio}")
                 
-                fallback_reason = file_result.get('fallback_reason', '')
-                if fallback_reason:
-                    summary_lines.append(f"Fallback Reason: {fallback_reason}")
+                    fallback_reason = file_result.get('fallback_reason', '')
+                    if fallback_reason:
+                        emit(f"Fallback Reason: {fallback_reason}")
         
-        summary_lines.append("")
-
-    with open(Path(report_dir) / "summary_report.md", "w") as f:
-        f.write("\n".join(summary_lines))
+            emit("")
 
     logger.info(
-        f"Summary report with Jpylyzer validation written to: {Path(report_dir) / 'summary_report.md'}")
+        f"Summary report with Jpylyzer validation written to: {summary_path}")
 
 
 def main():
@@ -204,7 +427,7 @@ def main():
     )
     parser.add_argument(
         "--document-type",
-        choices=[dt.name.lower() for dt in DocumentType],
+        choices=DOCUMENT_TYPE_CHOICES,
         default=DocumentType.PHOTOGRAPH.name.lower(),
         help="Type of document being processed"
     )
@@ -225,7 +448,7 @@ def main():
     )
     parser.add_argument(
         "--loglevel",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVEL_CHOICES,
         default="INFO",
         help="Logging level"
     )
@@ -265,7 +488,7 @@ def main():
     )
     parser.add_argument(
         "--compression-mode",
-        choices=[mode.value for mode in CompressionMode],
+        choices=COMPRESSION_MODE_CHOICES,
         default=CompressionMode.SUPERVISED.value,
         help="Compression mode to use"
     )
@@ -362,6 +585,13 @@ def main():
         default=1000000,
         help="Number of pixels to process at once for large images (default: 1000000)"
     )
+    parser.add_argument(
+        "--analysis-max-dim",
+        type=_positive_int,
+        default=None,
+        help="Downsample images so the longest side is at most this many pixels "
+             "before quality analysis (default: analyze at full resolution)"
+    )
     parser.add_argument(
         "--no-compression",
         action="store_true",
@@ -427,7 +657,8 @@ def main():
             from importlib.metadata import version as get_version
             version = get_version("jp2forge")
         except Exception:
-            version = "0.9.7"  # Default version if not installed as package
+            # Not installed as a package: read the version from the source tree
+            version = _read_source_version() or "unknown"
         print(f"JP2Forge version {version}")
         return 0
 
@@ -451,7 +682,13 @@ def main():
             with open(args.config, 'r') as f:
                 config_dict = json.load(f)
             config = WorkflowConfig.from_dict(config_dict)
+            # Config files bypass argparse; apply the --analysis-max-dim check
+            if config.analysis_max_dim is not None:
+                config.analysis_max_dim = _positive_int(config.analysis_max_dim)
             logger.info(f"Loaded configuration from {args.config}")
+        except argparse.ArgumentTypeError as e:
+            logger.error(f"Invalid analysis_max_dim in {args.config}: {e}")
+            return 1
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
             return 1
@@ -491,9 +728,14 @@ def main():
             collector_threads=args.collector_threads,
             converter_threads=args.converter_threads or args.max_workers,
             target_compression_ratio=args.compression_ratio,
-            target_size=args.target_size
+            target_size=args.target_size,
+            analysis_max_dim=args.analysis_max_dim
         )
 
+    # Snapshot the configuration once; it is saved here and embedded in the
+    # summary report after processing (workflows do not modify it)
+    config_dict = config.to_dict()
+
     # Save configuration if requested
     if args.save_config:
         try:
@@ -501,7 +743,7 @@ def main():
             if save_dir and not os.path.exists(save_dir):
                 os.makedirs(save_dir, exist_ok=True)
             with open(args.save_config, 'w') as f:
-                json.dump(config.to_dict(), f, indent=4)
+                json.dump(config_dict, f, indent=4)
             logger.info(f"Saved configuration to {args.save_config}")
         except Exception as e:
             logger.error(f"Error saving configuration: {str(e)}")
@@ -513,6 +755,7 @@ def main():
     logger.info(f"Compression mode: {config.compression_mode.value}")
     logger.info(f"Processing mode: {config.processing_mode.name}")
     if config.processing_mode == ProcessingMode.PARALLEL:
+        import multiprocessing
         logger.info(
             f"Using {config.max_workers or (multiprocessing.cpu_count() - 1)} worker processes")
     logger.info("-" * 80)
@@ -536,7 +779,12 @@ def main():
         logger.info(f"Processing single file: {args.input_path}")
 
         result = workflow.process_file(args.input_path)
-        
+
+        # Stat input and output once; the sizes are reused for the results
+        # dictionary and the log summary below
+        orig_bytes = _file_size(args.input_path)
+        conv_bytes = _file_size(result.output_file)
+
         # Create a results dictionary similar to what process_directory returns
         single_file_results = {
             'status': result.status,
@@ -545,9 +793,9 @@ def main():
                 'output_file': result.output_file,
                 'status': result.status.name,
                 'file_sizes': {
-                    'original_size_human': f"{os.path.getsize(args.input_path) / (1024 * 1024):.2f} MB" if os.path.exists(args.input_path) else "N/A",
-                    'converted_size_human': f"{os.path.getsize(result.output_file) / (1024 * 1024):.2f} MB" if result.output_file and os.path.exists(result.output_file) else "N/A",
-                    'compression_ratio': os.path.getsize(args.input_path) / os.path.getsize(result.output_file) if result.output_file and os.path.exists(result.output_file) and os.path.getsize(result.output_file) > 0 else "N/A"
+                    'original_size_human': f"{orig_bytes / (1024 * 1024):.2f} MB" if orig_bytes is not None else "N/A",
+                    'converted_size_human': f"{conv_bytes / (1024 * 1024):.2f} MB" if conv_bytes is not None else "N/A",
+                    'compression_ratio': orig_bytes / conv_bytes if orig_bytes is not None and conv_bytes else "N/A"
                 }
             }],
             'success_count': 1 if result.status != WorkflowStatus.FAILURE else 0,
@@ -558,14 +806,15 @@ def main():
         
         # Generate validation and reports just like in directory processing
         output_dir = args.output_dir or config.output_dir
-        validate_output_with_jpylyzer(output_dir, args.report_dir)
-        generate_summary_report_with_jpylyzer(single_file_results, config.to_dict(), args.report_dir)
+        validity = validate_output_with_jpylyzer(output_dir, args.report_dir, max_workers=1)
+        generate_summary_report_with_jpylyzer(
+            single_file_results, config_dict, args.report_dir, validity=validity)
 
         logger.info("-" * 80)
         logger.info(f"Processing status: {result.status.name}")
 
         if result.output_file:
-            orig_size = os.path.getsize(args.input_path) / (1024 * 1024)
+            orig_size = (orig_bytes or 0) / (1024 * 1024)
             
             # Handle multiple output files (multi-page TIFFs)
             if ',' in result.output_file:
@@ -574,13 +823,14 @@ def main():
                 valid_files = []
                 for f in output_files:
                     f = f.strip()
-                    if os.path.exists(f):
-                        total_size += os.path.getsize(f)
+                    size = _file_size(f)
+                    if size is not None:
+                        total_size += size
                         valid_files.append(f)
                 new_size = total_size / (1024 * 1024)
                 logger.info(f"Generated {len(valid_files)} JP2 files from multi-page TIFF")
             else:
-                new_size = os.path.getsize(result.output_file) / (1024 * 1024)
+                new_size = (conv_bytes or 0) / (1024 * 1024)
                 
             compression_ratio = orig_size / new_size if new_size > 0 else 0
 
@@ -608,11 +858,12 @@ def main():
             metadata=metadata
         )
         # JPylyzer validation and reporting
-        validate_output_with_jpylyzer(args.output_dir, args.report_dir)
+        validity = validate_output_with_jpylyzer(args.output_dir, args.report_dir, config.max_workers)
         logger.info(f"JPylyzer validation reports written to: {args.report_dir}")
 
         # Generate summary report
-        generate_summary_report_with_jpylyzer(results, config.to_dict(), args.report_dir, args.full_report)
+        generate_summary_report_with_jpylyzer(
+            results, config_dict, args.report_dir, args.full_report, validity=validity)
 
         logger.info("-" * 80)
         logger.info(f"Processing status: {results['status'].name}")
@@ -623,16 +874,17 @@ def main():
             return 1
 
         # Only access these keys if directory processing was successful
-        logger.info(f"Files processed: {len(results.get('processed_files', []))}")
+        total_files = len(results.get('processed_files', []))
+        logger.info(f"Files processed: {total_files}")
         logger.info(f"Successful: {results.get('success_count', 0)}")
         logger.info(f"Warnings: {results.get('warning_count', 0)}")
         logger.info(f"Errors: {results.get('error_count', 0)}")
 
         if 'processing_time' in results:
             logger.info(f"Processing time: {results['processing_time']:.2f} seconds")
-            if results['processing_time'] > 0 and len(results.get('processed_files', [])) > 0:
+            if results['processing_time'] > 0 and total_files > 0:
                 logger.info(
-                    f"Processing rate: {len(results['processed_files']) / results['processing_time']:.2f} files/second")
+                    f"Processing rate: {total_files / results['processing_time']:.2f} files/second")
 
         if results.get('summary_report'):
             logger.info(f"Summary report: {results['summary_report']}")
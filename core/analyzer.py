@@ -13,11 +13,40 @@ from PIL import Image
 from typing import Dict, Any, Optional, Tuple
 
 from core.types import AnalysisResult, WorkflowStatus
-from utils.image import calculate_mse, calculate_psnr, calculate_ssim, peak_signal_value
+from utils.image import (
+    SSIM_WIN_SIZE,
+    calculate_mse,
+    calculate_psnr,
+    calculate_ssim,
+    peak_signal_value,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _block_reduce(array: np.ndarray, factor: int) -> np.ndarray:
+    """Downsample an image array by averaging factor x factor blocks.
+
+    Trailing rows/columns that do not fill a whole block are dropped. The
+    result keeps the input dtype so the peak signal value is unchanged.
+
+    Args:
+        array: Image as NumPy array (2D, or 3D with channels last)
+        factor: Integer reduction factor
+
+    Returns:
+        np.ndarray: Reduced image
+    """
+    rows = array.shape[0] // factor
+    cols = array.shape[1] // factor
+    blocks = array[:rows * factor, :cols * factor].reshape(
+        (rows, factor, cols, factor) + array.shape[2:])
+    reduced = blocks.mean(axis=(1, 3), dtype=np.float64)
+    if np.issubdtype(array.dtype, np.integer):
+        reduced = np.rint(reduced)
+    return reduced.astype(array.dtype)
+
+
 class ImageAnalyzer:
     """Handles image analysis and quality assessment."""
 
@@ -26,7 +55,8 @@ class ImageAnalyzer:
         psnr_threshold: float = 40.0,
         ssim_threshold: float = 0.95,
         mse_threshold: float = 50.0,
-        report_dir: Optional[str] = None
+        report_dir: Optional[str] = None,
+        max_dim: Optional[int] = None
     ):
         """Initialize the analyzer.
 
@@ -35,11 +65,17 @@ class ImageAnalyzer:
             ssim_threshold: SSIM threshold for quality control
             mse_threshold: MSE threshold for quality control
             report_dir: Directory for reports
+            max_dim: If set, images whose longest side exceeds this are
+                block-averaged down before computing metrics (None: full size)
         """
+        if max_dim is not None and max_dim < 1:
+            raise ValueError(f"max_dim must be at least 1, got {max_dim}")
+
         self.psnr_threshold = psnr_threshold
         self.ssim_threshold = ssim_threshold
         self.mse_threshold = mse_threshold
         self.report_dir = report_dir
+        self.max_dim = max_dim
 
         if report_dir:
             os.makedirs(report_dir, exist_ok=True)
@@ -61,11 +97,25 @@ class ImageAnalyzer:
             AnalysisResult: Analysis results
         """
         try:
-            # Load images
+            # Load images. np.asarray wraps Pillow's buffer without a second
+            # copy; the arrays are read-only, which the metrics respect, and
+            # keep their native dtype (the metrics widen band by band)
             with Image.open(original_path) as orig_img:
-                orig_array = np.array(orig_img)
+                orig_array = np.asarray(orig_img)
             with Image.open(converted_path) as conv_img:
-                conv_array = np.array(conv_img)
+                conv_array = np.asarray(conv_img)
+
+            # Optionally analyze a reduced copy of oversized images; both
+            # sides are reduced by the same integer factor
+            if self.max_dim and orig_array.shape == conv_array.shape:
+                longest = max(orig_array.shape[0], orig_array.shape[1])
+                shortest = min(orig_array.shape[0], orig_array.shape[1])
+                # Never reduce the short side below one SSIM window
+                factor = min(-(-longest // self.max_dim), shortest // SSIM_WIN_SIZE)
+                if factor > 1:
+                    logger.debug(f"Reducing images by {factor}x for analysis")
+                    orig_array = _block_reduce(orig_array, factor)
+                    conv_array = _block_reduce(conv_array, factor)
 
             # Calculate metrics using the peak value of the source bit depth
             max_pixel = peak_signal_value(orig_array)
@@ -165,8 +215,9 @@ class ImageAnalyzer:
             }
 
             # Write report to file
+            report_json = json.dumps(report_data, indent=4)
             with open(report_path, 'w') as f:
-                json.dump(report_data, f, indent=4)
+                f.write(report_json)
 
             logger.info(f"Saved analysis report to {report_path}")
             return report_path
@@ -219,12 +270,11 @@ class ImageAnalyzer:
         Returns:
             str: Human-readable file size
         """
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(size_in_bytes)
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        # Each unit is 2**10 of the previous one, so the unit index is the
+        # number of whole 10-bit groups above the lowest
         unit_index = 0
+        if size_in_bytes >= 1:
+            unit_index = min((int(size_in_bytes).bit_length() - 1) // 10, len(units) - 1)
 
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        return f"{size:.2f} {units[unit_index]}"
+        return f"{size_in_bytes / (1 << (10 * unit_index)):.2f} {units[unit_index]}"
@@ -7,17 +7,42 @@ to JPEG2000 format with various quality settings.
 
 import os
 import logging
-import gc
-import subprocess
+import shutil
 import math
 import numpy as np
 from PIL import Image
 from typing import Dict, Any, Optional, Union, Tuple, List
 
 from core.types import DocumentType, CompressionMode, BnFCompressionRatio
+from utils.color_profiles import ensure_jp2_compatible_profile
+from utils.image import probe_image, should_process_in_chunks
 
 logger = logging.getLogger(__name__)
 
+# Lossy quality layers (quality_mode, layers) per document type
+_QUALITY_LAYERS = {
+    DocumentType.PHOTOGRAPH: ("rates", (60, 40, 20)),
+    DocumentType.HERITAGE_DOCUMENT: ("dB", (45, 40, 35)),
+    DocumentType.COLOR: ("rates", (50, 30, 10)),
+    DocumentType.GRAYSCALE: ("rates", (40, 30, 20)),
+}
+_DEFAULT_QUALITY_LAYERS = ("rates", (50, 30, 10))
+
+# BnF code-block and tile grid
+_BNF_TILING = {
+    "codeblock_size": (64, 64),  # BnF uses 64x64 codeblocks
+    "tile_size": (1024, 1024),  # BnF uses 1024x1024 tiles
+}
+
+# Recommended settings by image size, largest first: (pixels above which
+# the class applies, num_resolutions, quality layers, chunked processing,
+# working bytes per pixel, description, note suffix)
+_SIZE_CLASSES = (
+    (50000000, 12, 5, True, 12, "Large image", ". Consider chunked processing."),  # >50MP
+    (10000000, 10, 3, False, 8, "Medium-large image", ""),  # >10MP
+    (0, 10, 3, False, 4, "Standard image", ""),
+)
+
 
 class JPEG2000Compressor:
     """Handles JPEG2000 compression operations.
@@ -31,7 +56,8 @@ class JPEG2000Compressor:
         num_resolutions: int = 10,
         progression_order: str = "RPCL",
         chunk_size: int = 1000000,  # Default 1M pixels per chunk
-        memory_limit_mb: int = 4096  # Default 4GB memory limit
+        memory_limit_mb: int = 4096,  # Default 4GB memory limit
+        align_to_resolution_grid: bool = True
     ):
         """Initialize the compressor.
 
@@ -40,11 +66,15 @@ class JPEG2000Compressor:
             progression_order: Progression order for JPEG2000
             chunk_size: Number of pixels to process at once for large images
             memory_limit_mb: Memory limit in MB for adaptive processing
+            align_to_resolution_grid: Whether to round strip-tile heights
+                to a multiple of 2**num_resolutions rows for lossless
+                chunked encoding
         """
         self.num_resolutions = num_resolutions
         self.progression_order = progression_order
         self.chunk_size = chunk_size
         self.memory_limit_mb = memory_limit_mb
+        self.align_to_resolution_grid = align_to_resolution_grid
 
     def convert_to_jp2(
         self,
@@ -80,95 +110,111 @@ class JPEG2000Compressor:
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Input file does not exist: {input_file}")
 
-        try:
-            # Determine if we need to use lossless compression
-            use_lossless = (compression_mode == CompressionMode.LOSSLESS)
+        # The requested mode first, then lossless if allowed
+        modes = [compression_mode]
+        if lossless_fallback and compression_mode != CompressionMode.LOSSLESS:
+            modes.append(CompressionMode.LOSSLESS)
 
-            # If BnF compliant, use special processing path
-            if bnf_compliant or (compression_mode == CompressionMode.BNF_COMPLIANT):
-                success = self._convert_bnf_compliant(
+        for attempt, mode in enumerate(modes):
+            has_fallback = attempt + 1 < len(modes)
+            try:
+                if self._convert_once(
                     input_file,
                     output_file,
                     doc_type,
-                    use_lossless,
+                    mode,
+                    bnf_compliant,
                     compression_ratio_tolerance,
                     include_bnf_markers
-                )
-                if not success and lossless_fallback and not use_lossless:
-                    logger.info("BnF compliant conversion failed, falling back to lossless...")
-                    return self.convert_to_jp2(
-                        input_file,
-                        output_file,
-                        doc_type,
-                        CompressionMode.LOSSLESS,
-                        False,  # No further fallback
-                        bnf_compliant,
-                        compression_ratio_tolerance,
-                        include_bnf_markers
-                    )
-                return success
-            else:
-                # Check if we need to process in chunks
-                from utils.image import should_process_in_chunks
-                should_chunk, chunk_size = should_process_in_chunks(
-                    input_file, self.memory_limit_mb)
-
-                if should_chunk:
-                    return self._convert_to_jp2_chunked(
-                        input_file,
-                        output_file,
-                        doc_type,
-                        use_lossless,
-                        chunk_size or self.chunk_size
-                    )
-                else:
-                    # Regular processing path (using Pillow)
-                    try:
-                        with Image.open(input_file) as img:
-                            # Ensure color profile is compatible with JPEG2000
-                            from utils.color_profiles import ensure_jp2_compatible_profile
-                            img = ensure_jp2_compatible_profile(img)
-
-                            # Configure compression parameters based on document type
-                            params = self._get_compression_params(doc_type, use_lossless, img_size=img.size)
-
-                            # Convert to JPEG2000
-                            img.save(
-                                output_file,
-                                format="JPEG2000",
-                                **params
-                            )
-                    except OSError as e:
-                        logger.error(f"Failed to open or process image: {str(e)}")
-                        raise
-
-            # Force garbage collection
-            gc.collect()
-
-            return True
+                ):
+                    return True
+                if has_fallback:
+                    logger.info("Conversion failed, falling back to lossless...")
 
-        except Exception as e:
-            logger.error(f"Error converting {input_file}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Error converting {input_file}: {str(e)}")
 
-            # Try lossless fallback if enabled and not already using lossless
-            if lossless_fallback and compression_mode != CompressionMode.LOSSLESS:
-                logger.info("Attempting lossless fallback...")
-                return self.convert_to_jp2(
-                    input_file,
+                if has_fallback:
+                    logger.info("Attempting lossless fallback...")
+                    continue
+
+                # If error is critical and fallback didn't work, propagate it
+                if isinstance(e, (FileNotFoundError, PermissionError, OSError)):
+                    raise
+
+        return False
+
+    def _convert_once(
+        self,
+        input_file: str,
+        output_file: str,
+        doc_type: DocumentType,
+        compression_mode: CompressionMode,
+        bnf_compliant: bool,
+        compression_ratio_tolerance: float,
+        include_bnf_markers: bool
+    ) -> bool:
+        """Run a single conversion attempt, without any fallback.
+
+        Args:
+            input_file: Path to input image
+            output_file: Path for output JP2 file
+            doc_type: Type of document being processed
+            compression_mode: Compression mode to use
+            bnf_compliant: Whether to use BnF compliant settings
+            compression_ratio_tolerance: Tolerance for compression ratio
+            include_bnf_markers: Whether to include BnF robustness markers
+
+        Returns:
+            bool: True if conversion successful
+        """
+        # Determine if we need to use lossless compression
+        use_lossless = (compression_mode == CompressionMode.LOSSLESS)
+
+        # If BnF compliant, use special processing path
+        if bnf_compliant or (compression_mode == CompressionMode.BNF_COMPLIANT):
+            return self._convert_bnf_compliant(
+                input_file,
+                output_file,
+                doc_type,
+                use_lossless,
+                compression_ratio_tolerance,
+                include_bnf_markers
+            )
+
+        # Check if we need to process in chunks
+        should_chunk, chunk_size = should_process_in_chunks(
+            input_file, self.memory_limit_mb)
+
+        if should_chunk:
+            return self._convert_to_jp2_chunked(
+                input_file,
+                output_file,
+                doc_type,
+                use_lossless,
+                chunk_size or self.chunk_size
+            )
+
+        # Regular processing path (using Pillow)
+        try:
+            with Image.open(input_file) as img:
+                # Ensure color profile is compatible with JPEG2000
+                img = ensure_jp2_compatible_profile(img)
+
+                # Configure compression parameters based on document type
+                params = self._get_compression_params(doc_type, use_lossless, img_size=img.size)
+
+                # Convert to JPEG2000
+                img.save(
                     output_file,
-                    doc_type,
-                    CompressionMode.LOSSLESS,
-                    lossless_fallback=False,
-                    bnf_compliant=bnf_compliant,
-                    compression_ratio_tolerance=compression_ratio_tolerance,
-                    include_bnf_markers=include_bnf_markers
+                    format="JPEG2000",
+                    **params
                 )
+        except OSError as e:
+            logger.error(f"Failed to open or process image: {str(e)}")
+            raise
 
-            # If error is critical and fallback didn't work, propagate it
-            if isinstance(e, (FileNotFoundError, PermissionError, OSError)):
-                raise
-
-            return False
+        return True
 
     def _convert_to_jp2_chunked(
         self,
@@ -197,54 +243,44 @@ class JPEG2000Compressor:
         try:
             logger.info(f"Processing {input_file} in chunks")
 
-            # Open the image to get dimensions and mode
+            # Strips that are not a multiple of the wavelet grid get padded
+            # and boundary-filtered at every seam, and short strips would
+            # also cap num_resolutions below
+            if self.align_to_resolution_grid:
+                grid = 1 << self.num_resolutions
+                rows_per_chunk = max(grid, rows_per_chunk // grid * grid)
+
             with Image.open(input_file) as img:
                 width, height = img.size
-                mode = img.mode
-
-                # Calculate number of chunks needed
-                num_chunks = math.ceil(height / rows_per_chunk)
-                logger.info(f"Image size: {width}x{height}, processing in {num_chunks} chunks")
-
-                # Create destination image once in RAM
-                merged_img = Image.new(mode, (width, height))
-
-                # Process image in chunks
-                for i in range(num_chunks):
-                    start_row = i * rows_per_chunk
-                    end_row = min((i + 1) * rows_per_chunk, height)
-
-                    # Create a box for cropping (left, upper, right, lower)
-                    box = (0, start_row, width, end_row)
-
-                    logger.info(
-                        f"Processing chunk {i+1}/{num_chunks}: rows {start_row}-{end_row}")
-
-                    # Crop this chunk
-                    chunk = img.crop(box)
-
-                    # Paste chunk into destination image
-                    merged_img.paste(chunk, (0, start_row))
-
-                    # Delete the chunk reference to free memory
-                    del chunk
-
-                    # Force garbage collection after each chunk
-                    gc.collect()
+                tile_rows = min(rows_per_chunk, height)
 
                 # Configure compression parameters
                 if params_override is not None:
-                    params = params_override
+                    params = dict(params_override)
                 else:
                     params = self._get_compression_params(
                         doc_type, lossless, img_size=(width, height))
 
-                # Save merged image once to final destination
-                merged_img.save(output_file, format="JPEG2000", **params)
+                # Encode the source directly, so no merged copy of the image
+                # is built. Lossless encodes use a grid of full-width strip
+                # tiles, which the encoder writes one at a time into the
+                # final codestream. Lossy rate layers are allocated per tile,
+                # so strips would shift quality between them; those stay
+                # untiled. An explicit tile grid (BnF) is kept as-is.
+                if lossless and "tile_size" not in params:
+                    params["tile_size"] = (width, tile_rows)
+
+                if "tile_size" in params:
+                    tile_w, tile_h = params["tile_size"]
+                    max_res = max(1, int(math.log2(min(width, height, tile_w, tile_h))))
+                    params["num_resolutions"] = min(params["num_resolutions"], max_res)
+
+                    num_chunks = -(-height // tile_h)
+                    logger.info(
+                        f"Image size: {width}x{height}, encoding {num_chunks} "
+                        f"tile rows of up to {tile_h} pixels")
 
-                # Cleanup destination image
-                del merged_img
-                gc.collect()
+                img.save(output_file, format="JPEG2000", **params)
 
                 return True
 
@@ -283,10 +319,7 @@ class JPEG2000Compressor:
 
         if bnf_compliant:
             # Add BnF-specific parameters
-            params.update({
-                "codeblock_size": (64, 64),  # BnF uses 64x64 codeblocks
-                "tile_size": (1024, 1024),  # BnF uses 1024x1024 tiles
-            })
+            params.update(_BNF_TILING)
 
         # Rate/quality layers force the encoder to discard data to hit the
         # target rates, even with the reversible wavelet — a truly lossless
@@ -294,31 +327,9 @@ class JPEG2000Compressor:
         if lossless:
             return params
 
-        if doc_type == DocumentType.PHOTOGRAPH:
-            params.update({
-                "quality_mode": "rates",
-                "quality_layers": [60, 40, 20]
-            })
-        elif doc_type == DocumentType.HERITAGE_DOCUMENT:
-            params.update({
-                "quality_mode": "dB",
-                "quality_layers": [45, 40, 35]
-            })
-        elif doc_type == DocumentType.COLOR:
-            params.update({
-                "quality_mode": "rates",
-                "quality_layers": [50, 30, 10]
-            })
-        elif doc_type == DocumentType.GRAYSCALE:
-            params.update({
-                "quality_mode": "rates",
-                "quality_layers": [40, 30, 20]
-            })
-        else:  # Default parameters
-            params.update({
-                "quality_mode": "rates",
-                "quality_layers": [50, 30, 10]
-            })
+        quality_mode, quality_layers = _QUALITY_LAYERS.get(doc_type, _DEFAULT_QUALITY_LAYERS)
+        params["quality_mode"] = quality_mode
+        params["quality_layers"] = list(quality_layers)
 
         return params
 
@@ -349,14 +360,13 @@ class JPEG2000Compressor:
             # Get BnF compression ratio for document type
             target_ratio = BnFCompressionRatio.get_ratio_for_type(doc_type)
 
-            with Image.open(input_file) as probe:
-                img_size = probe.size
+            probe = probe_image(input_file)
+            img_size = (probe.width, probe.height)
 
             params = self._get_bnf_compression_params(
                 img_size, lossless, target_ratio, include_bnf_markers)
 
             # Check if we need to process in chunks
-            from utils.image import should_process_in_chunks
             should_chunk, chunk_size = should_process_in_chunks(input_file, self.memory_limit_mb)
 
             if should_chunk:
@@ -373,7 +383,6 @@ class JPEG2000Compressor:
                 # Otherwise use Pillow with BnF-compliant settings
                 with Image.open(input_file) as img:
                     # Ensure color profile is compatible with JPEG2000
-                    from utils.color_profiles import ensure_jp2_compatible_profile
                     img = ensure_jp2_compatible_profile(img)
 
                     # Save with BnF-compliant parameters
@@ -429,10 +438,7 @@ class JPEG2000Compressor:
         if include_bnf_markers:
             # Note: Pillow doesn't directly support SOP, EPH, PLT markers
             # but we'll add what we can through parameters
-            params.update({
-                "codeblock_size": (64, 64),  # BnF uses 64x64 codeblocks
-                "tile_size": (1024, 1024),  # BnF uses 1024x1024 tiles
-            })
+            params.update(_BNF_TILING)
 
         if not lossless:
             # Quality layers converging on the BnF target ratio; the final
@@ -459,16 +465,7 @@ class JPEG2000Compressor:
         Returns:
             bool: True if command is available
         """
-        try:
-            subprocess.run(
-                [command, "-version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=False
-            )
-            return True
-        except FileNotFoundError:
-            return False
+        return shutil.which(command) is not None
 
     def _check_compression_ratio(
         self,
@@ -490,12 +487,9 @@ class JPEG2000Compressor:
             bool: True if within acceptable range
         """
         try:
-            # Check if files exist
-            if not os.path.exists(original_file):
-                logger.error(f"Original file not found: {original_file}")
-                return False
-
-            if not os.path.exists(compressed_file):
+            try:
+                comp_size = os.stat(compressed_file).st_size
+            except FileNotFoundError:
                 logger.error(f"Compressed file not found: {compressed_file}")
                 return False
 
@@ -503,19 +497,19 @@ class JPEG2000Compressor:
             # (and rate allocation in the encoder works the same way), so
             # measure against raw pixel size rather than the source file
             # size, which depends on the source's own compression
-            with Image.open(original_file) as img:
-                width, height = img.size
-                num_bands = len(img.getbands())
-                if img.mode in ("I;16", "I;16L", "I;16B", "I;16N"):
-                    bytes_per_band = 2
-                elif img.mode in ("I", "F"):
-                    bytes_per_band = 4
-                else:
-                    bytes_per_band = 1
+            try:
+                width, height, mode, num_bands = probe_image(original_file)
+            except FileNotFoundError:
+                logger.error(f"Original file not found: {original_file}")
+                return False
+            if mode in ("I;16", "I;16L", "I;16B", "I;16N"):
+                bytes_per_band = 2
+            elif mode in ("I", "F"):
+                bytes_per_band = 4
+            else:
+                bytes_per_band = 1
             raw_size = width * height * num_bands * bytes_per_band
 
-            comp_size = os.path.getsize(compressed_file)
-
             if comp_size == 0:
                 logger.error(f"Compressed file is empty: {compressed_file}")
                 return False
@@ -570,43 +564,21 @@ class JPEG2000Compressor:
                 else:
                     color_info = f"special mode ({mode})"
 
-                # Base recommendations on image size, type and color information
-                if num_pixels > 50000000:  # >50MP
-                    # For very large images
-                    return {
-                        "num_resolutions": 12,
-                        "progression_order": "RPCL",  # Changed to RPCL for BnF compatibility
-                        "compression_mode": CompressionMode.BNF_COMPLIANT.value,
-                        "tile_size": 1024,
-                        "quality_layers": 5,
-                        "chunked_processing": True,
-                        "memory_required_mb": int(num_pixels * 12 / (1024 * 1024)),
-                        "notes": f"Large image ({width}x{height}, {color_info}) with BnF compliant settings. Consider chunked processing."
-                    }
-                elif num_pixels > 10000000:  # >10MP
-                    # For medium-large images
-                    return {
-                        "num_resolutions": 10,  # BnF standard
-                        "progression_order": "RPCL",
-                        "compression_mode": CompressionMode.BNF_COMPLIANT.value,
-                        "tile_size": 1024,  # BnF standard
-                        "quality_layers": 3,
-                        "chunked_processing": False,
-                        "memory_required_mb": int(num_pixels * 8 / (1024 * 1024)),
-                        "notes": f"Medium-large image ({width}x{height}, {color_info}) with BnF compliant settings"
-                    }
-                else:
-                    # For smaller images
-                    return {
-                        "num_resolutions": 10,  # BnF standard
-                        "progression_order": "RPCL",
-                        "compression_mode": CompressionMode.BNF_COMPLIANT.value,
-                        "tile_size": 1024,  # BnF standard
-                        "quality_layers": 3,
-                        "chunked_processing": False,
-                        "memory_required_mb": int(num_pixels * 4 / (1024 * 1024)),
-                        "notes": f"Standard image ({width}x{height}, {color_info}) with BnF compliant settings"
-                    }
+                # Base recommendations on image size, type and color information;
+                # the last size class catches everything below the others
+                _, num_res, layers, chunked, bytes_per_pixel, label, hint = next(
+                    (row for row in _SIZE_CLASSES if num_pixels > row[0]), _SIZE_CLASSES[-1])
+
+                return {
+                    "num_resolutions": num_res,
+                    "progression_order": "RPCL",  # RPCL for BnF compatibility
+                    "compression_mode": CompressionMode.BNF_COMPLIANT.value,
+                    "tile_size": 1024,  # BnF standard
+                    "quality_layers": layers,
+                    "chunked_processing": chunked,
+                    "memory_required_mb": (num_pixels * bytes_per_pixel) >> 20,
+                    "notes": f"{label} ({width}x{height}, {color_info}) with BnF compliant settings{hint}"
+                }
 
         except Exception as e:
             logger.error(f"Error getting recommended settings: {str(e)}")
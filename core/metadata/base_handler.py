@@ -8,6 +8,7 @@ JPEG2000 images, including reading, writing, and validation.
 import os
 import logging
 import json
+import shutil
 import subprocess
 import tempfile
 from datetime import datetime
@@ -63,25 +64,20 @@ class MetadataHandler:
         Raises:
             RuntimeError: If exiftool is not found
         """
-        try:
-            subprocess.run(
-                ['exiftool', '-ver'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
+        # PATH lookup without spawning the tool
+        if shutil.which('exiftool'):
             return 'exiftool'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Try common installation paths
-            paths = [
-                '/usr/local/bin/exiftool',
-                '/opt/homebrew/bin/exiftool',
-                '/usr/bin/exiftool'
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-            raise RuntimeError("exiftool not found. Please install exiftool.")
+
+        # Try common installation paths
+        paths = [
+            '/usr/local/bin/exiftool',
+            '/opt/homebrew/bin/exiftool',
+            '/usr/bin/exiftool'
+        ]
+        for path in paths:
+            if os.path.exists(path):
+                return path
+        raise RuntimeError("exiftool not found. Please install exiftool.")
 
     def read_metadata(self, jp2_file: str) -> Dict[str, Any]:
         """Read metadata from a JPEG2000 file.
@@ -153,7 +153,8 @@ class WorkflowConfig:
         collector_threads: int = 1,
         converter_threads: Optional[int] = None,
         target_compression_ratio: Optional[float] = None,
-        target_size: Optional[int] = None
+        target_size: Optional[int] = None,
+        analysis_max_dim: Optional[int] = None
     ):
         """Initialize the workflow configuration.
 
@@ -195,6 +196,8 @@ class WorkflowConfig:
             converter_threads: Number of threads to use for conversion
             target_compression_ratio: Target compression ratio (e.g., 20 for 20:1)
             target_size: Target size in bytes for compressed images
+            analysis_max_dim: Downsample images so their longest side is at
+                most this many pixels before quality analysis (None: full size)
         """
         self.output_dir = output_dir
         self.report_dir = report_dir
@@ -239,6 +242,7 @@ class WorkflowConfig:
         self.converter_threads = converter_threads
         self.target_compression_ratio = target_compression_ratio
         self.target_size = target_size
+        self.analysis_max_dim = analysis_max_dim
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'WorkflowConfig':
@@ -309,4 +313,5 @@ class WorkflowConfig:
             'converter_threads': self.converter_threads,
             'target_compression_ratio': self.target_compression_ratio,
             'target_size': self.target_size,
+            'analysis_max_dim': self.analysis_max_dim,
         }
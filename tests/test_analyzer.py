@@ -0,0 +1,109 @@
+"""Tests for reduced-resolution quality analysis (analysis_max_dim)."""
+
+import json
+import math
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import cli.workflow as cli_workflow
+import workflow.standard
+from core.analyzer import ImageAnalyzer, _block_reduce
+from core.types import CompressionMode, DocumentType, WorkflowConfig
+from workflow.parallel import standalone_process_file_worker
+
+
+class TestBlockReduce:
+    def test_keeps_dtype(self):
+        for dtype in (np.uint8, np.uint16, np.float32):
+            arr = np.ones((8, 8, 3), dtype=dtype)
+            assert _block_reduce(arr, 2).dtype == dtype
+
+    def test_integer_means_are_rounded(self):
+        arr = np.array([[1, 2], [2, 2]], dtype=np.uint8)  # mean 1.75
+        assert _block_reduce(arr, 2)[0, 0] == 2
+        arr = np.array([[0, 1], [0, 0]], dtype=np.uint8)  # mean 0.25
+        assert _block_reduce(arr, 2)[0, 0] == 0
+
+    def test_trailing_rows_and_columns_dropped(self):
+        arr = np.arange(35, dtype=np.uint16).reshape(5, 7)
+        reduced = _block_reduce(arr, 2)
+        assert reduced.shape == (2, 3)
+        assert reduced[1, 2] == np.rint(arr[2:4, 4:6].mean())
+
+
+class TestMaxDim:
+    @pytest.fixture()
+    def pair(self, tmp_path):
+        def make(shape):
+            rng = np.random.default_rng(1)
+            arr = rng.integers(0, 256, shape, dtype=np.uint8)
+            noisy = np.clip(arr.astype(int) + rng.integers(-3, 4, shape), 0, 255)
+            orig, conv = tmp_path / "orig.png", tmp_path / "conv.png"
+            Image.fromarray(arr).save(orig)
+            Image.fromarray(noisy.astype(np.uint8)).save(conv)
+            return str(orig), str(conv)
+        return make
+
+    def test_tiny_max_dim_keeps_one_ssim_window(self, pair):
+        # max_dim=1 used to reduce to an empty array and divide by zero
+        result = ImageAnalyzer(max_dim=1).analyze_pixel_loss(*pair((64, 48)))
+        assert result.error is None
+        assert math.isfinite(result.ssim)
+
+    def test_extreme_aspect_ratio(self, pair):
+        result = ImageAnalyzer(max_dim=100).analyze_pixel_loss(*pair((8, 2000)))
+        assert result.error is None
+        assert math.isfinite(result.ssim)
+
+    def test_rejects_values_below_one(self):
+        with pytest.raises(ValueError):
+            ImageAnalyzer(max_dim=0)
+
+
+class TestPlumbing:
+    def test_config_reaches_analyzer(self, tmp_path):
+        config = WorkflowConfig(
+            output_dir=str(tmp_path / "output"),
+            report_dir=str(tmp_path / "reports"),
+            analysis_max_dim=256,
+        )
+        assert config.to_dict()["analysis_max_dim"] == 256
+        assert workflow.standard.StandardWorkflow(config).analyzer.max_dim == 256
+
+    def test_parallel_worker_passes_max_dim(self, tmp_path, monkeypatch):
+        seen = {}
+
+        class FakeWorkflow:
+            def __init__(self, config):
+                seen["max_dim"] = config.analysis_max_dim
+
+            def _process_file_implementation(self, **kwargs):
+                raise RuntimeError("stop")
+
+        monkeypatch.setattr(workflow.standard, "StandardWorkflow", FakeWorkflow)
+        standalone_process_file_worker(
+            "in.tif", str(tmp_path), str(tmp_path), DocumentType.PHOTOGRAPH,
+            40.0, 6, "RPCL", CompressionMode.SUPERVISED, True, False, 0.05, True,
+            analysis_max_dim=128,
+        )
+        assert seen["max_dim"] == 128
+
+    def test_config_file_value_is_validated(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({
+            "output_dir": str(tmp_path / "output"),
+            "report_dir": str(tmp_path / "reports"),
+            "analysis_max_dim": 0,
+        }))
+
+        def fail(config):
+            raise AssertionError("workflow created from an invalid config")
+
+        monkeypatch.setattr(cli_workflow, "create_workflow", fail)
+        monkeypatch.setattr(sys, "argv", [
+            "jp2forge", str(tmp_path / "in.tif"), str(tmp_path / "output"),
+            "--config", str(config_file)])
+        assert cli_workflow.main() == 1
@@ -0,0 +1,201 @@
+"""Tests for the jpylyzer validation and reporting helpers in cli.workflow."""
+
+import concurrent.futures
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import cli.workflow as cli_workflow
+from core.types import ProcessingResult, WorkflowStatus
+
+
+class TestDumpJson:
+    def test_matches_stdlib_for_plain_reports(self):
+        obj = {"a.jp2": {"isValid": True, "sizes": [1, 2]}}
+        assert json.loads(cli_workflow._dump_json(obj)) == obj
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self):
+        # orjson raises TypeError on non-str keys and integers wider than
+        # 64 bits; json.dumps handles both
+        for obj in ({"a": {1: 2}}, 2 ** 70):
+            expected = json.dumps(obj, indent=2).encode("utf-8")
+            assert cli_workflow._dump_json(obj) == expected
+
+
+class _StubOrjson:
+    """Minimal orjson stand-in with the real library's failure modes."""
+
+    OPT_INDENT_2 = 1
+
+    class JSONDecodeError(ValueError):
+        pass
+
+    @classmethod
+    def dumps(cls, obj, option=None):
+        return json.dumps(cls._normalize(obj), indent=2).encode("utf-8")
+
+    @classmethod
+    def _normalize(cls, obj):
+        # Like orjson: reject wide integers and non-str keys, write NaN as null
+        if isinstance(obj, dict):
+            if not all(isinstance(key, str) for key in obj):
+                raise TypeError("Dict key must be str")
+            return {key: cls._normalize(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [cls._normalize(value) for value in obj]
+        if isinstance(obj, int) and not -2 ** 63 <= obj < 2 ** 64:
+            raise TypeError("Integer exceeds 64-bit range")
+        if isinstance(obj, float) and obj != obj:
+            return None
+        return obj
+
+    @classmethod
+    def loads(cls, data):
+        try:
+            return json.loads(data, parse_constant=cls._reject_constant)
+        except ValueError as e:
+            raise cls.JSONDecodeError(str(e)) from None
+
+    @staticmethod
+    def _reject_constant(name):
+        raise ValueError(f"unexpected constant {name}")
+
+
+@pytest.fixture(params=["stub", "orjson"])
+def orjson_backend(request, monkeypatch):
+    if request.param == "orjson":
+        backend = pytest.importorskip("orjson")
+    else:
+        backend = _StubOrjson
+    monkeypatch.setattr(cli_workflow, "USING_ORJSON", True)
+    monkeypatch.setattr(cli_workflow, "orjson", backend, raising=False)
+    return backend
+
+
+class TestOrjsonBackend:
+    def test_roundtrip(self, orjson_backend):
+        obj = {"a.jp2": {"isValid": True, "sizes": [1, 2]}}
+        assert cli_workflow._load_json(cli_workflow._dump_json(obj)) == obj
+
+    def test_rejected_values_fall_back_to_stdlib(self, orjson_backend):
+        for obj in ({"a": {1: 2}}, 2 ** 70):
+            expected = json.dumps(obj, indent=2).encode("utf-8")
+            assert cli_workflow._dump_json(obj) == expected
+
+    def test_stdlib_fallback_output_loads_back(self, orjson_backend):
+        # An oversized integer sends _dump_json to the stdlib, which also
+        # writes NaN; orjson cannot parse that, so _load_json must retry
+        obj = {"big": 2 ** 70, "ratio": float("nan")}
+        data = cli_workflow._dump_json(obj)
+        assert b"NaN" in data
+
+        loaded = cli_workflow._load_json(data)
+        assert loaded["big"] == 2 ** 70
+        assert loaded["ratio"] != loaded["ratio"]
+
+
+def _write_jp2(path, value):
+    Image.fromarray(np.full((16, 16), value, dtype=np.uint8)).save(path)
+
+
+class TestValidateOutput:
+    def test_hidden_files_included_links_and_dirs_skipped(self, tmp_path):
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        _write_jp2(out_dir / "a.jp2", 10)
+        _write_jp2(out_dir / ".hidden.jp2", 20)
+        (out_dir / "link.jp2").symlink_to(out_dir / "a.jp2")
+        (out_dir / "dir.jp2").mkdir()
+
+        validity = cli_workflow.validate_output_with_jpylyzer(
+            str(out_dir), str(tmp_path / "reports"), max_workers=1)
+
+        assert sorted(validity) == [".hidden.jp2", "a.jp2"]
+
+    def test_parallel_report_matches_listing_and_returned_map(self, tmp_path):
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        for i in range(3):
+            _write_jp2(out_dir / f"img{i}.jp2", 40 * i)
+        report_dir = tmp_path / "reports"
+
+        validity = cli_workflow.validate_output_with_jpylyzer(
+            str(out_dir), str(report_dir), max_workers=2)
+
+        with open(report_dir / "info_jpylyzer.json", "rb") as f:
+            written = json.loads(f.read())
+        listing = [name for name in os.listdir(out_dir) if name.endswith(".jp2")]
+        assert list(written) == listing
+        assert validity == cli_workflow._validity_map(written)
+
+    def test_single_file_run_validates_without_a_pool(self, tmp_path, monkeypatch):
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        # An earlier run's output sharing the directory
+        _write_jp2(out_dir / "previous.jp2", 60)
+        input_file = tmp_path / "in.tif"
+        Image.fromarray(np.zeros((16, 16), dtype=np.uint8)).save(input_file)
+
+        class FakeWorkflow:
+            def process_file(self, input_file):
+                output_file = str(out_dir / "in.jp2")
+                _write_jp2(output_file, 30)
+                return ProcessingResult(WorkflowStatus.SUCCESS, input_file, output_file)
+
+        class NoPool:
+            def __init__(self, *args, **kwargs):
+                raise AssertionError("process pool created for a single file")
+
+        monkeypatch.setattr(cli_workflow, "create_workflow", lambda config: FakeWorkflow())
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", NoPool)
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(sys, "argv", [
+            "jp2forge", str(input_file), str(out_dir),
+            "--report-dir", str(tmp_path / "reports")])
+
+        assert cli_workflow.main() == 0
+        assert (tmp_path / "reports" / "info_jpylyzer.json").exists()
+
+
+class TestSummaryReport:
+    def test_passed_validity_matches_report_read_from_disk(self, tmp_path, monkeypatch):
+        class FixedDatetime:
+            @staticmethod
+            def now():
+                return datetime(2024, 1, 2, 3, 4, 5)
+
+        monkeypatch.setattr(cli_workflow, "datetime", FixedDatetime)
+
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        for i in range(2):
+            _write_jp2(out_dir / f"img{i}.jp2", 50 * i)
+        report_dir = tmp_path / "reports"
+        validity = cli_workflow.validate_output_with_jpylyzer(
+            str(out_dir), str(report_dir), max_workers=2)
+
+        results = {
+            "processed_files": [
+                {"input_file": f"img{i}.tif", "status": "SUCCESS",
+                 "output_file": str(out_dir / f"img{i}.jp2")}
+                for i in range(2)
+            ],
+            "status": "SUCCESS",
+        }
+        config = {"compression_mode": "supervised"}
+        summary = report_dir / "summary_report.md"
+
+        cli_workflow.generate_summary_report_with_jpylyzer(
+            dict(results), config, str(report_dir), validity=validity)
+        from_memory = summary.read_bytes()
+        cli_workflow.generate_summary_report_with_jpylyzer(
+            dict(results), config, str(report_dir))
+        from_disk = summary.read_bytes()
+
+        assert from_memory == from_disk
+        assert b"Jpylyzer Validation: None" not in from_disk
@@ -1,6 +1,7 @@
 """Conversion tests for JPEG2000Compressor (no ExifTool required)."""
 
 import os
+import struct
 
 import numpy as np
 import pytest
@@ -15,6 +16,14 @@ def compressor():
     return JPEG2000Compressor(num_resolutions=6)
 
 
+def _tile_size(path):
+    """Read (XTsiz, YTsiz) from the SIZ marker segment of a JP2 file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    siz = data.index(b"\xff\x4f\xff\x51") + 4
+    return struct.unpack(">II", data[siz + 20:siz + 28])
+
+
 class TestLossless:
     def test_rgb_roundtrip_bit_identical(self, compressor, photo_tif, tmp_path):
         # Lossless mode used to apply rate-based quality layers, which
@@ -35,6 +44,56 @@ class TestLossless:
         assert orig.dtype == conv.dtype == np.uint16
         assert np.array_equal(orig, conv)
 
+    def test_chunked_roundtrip_bit_identical(self, compressor, photo_tif, tmp_path):
+        out = str(tmp_path / "chunked.jp2")
+        assert compressor._convert_to_jp2_chunked(
+            photo_tif, out, DocumentType.PHOTOGRAPH, True, rows_per_chunk=10)
+        orig = np.array(Image.open(photo_tif))
+        conv = np.array(Image.open(out))
+        assert np.array_equal(orig, conv)
+
+
+class TestChunked:
+    def test_lossy_matches_untiled_encode(self, compressor, tmp_path):
+        # Rate layers are allocated per tile, so strip tiling shifted
+        # quality between a smooth top half and a textured bottom half
+        rng = np.random.default_rng(3)
+        arr = np.empty((512, 384, 3), dtype=np.uint8)
+        arr[:256] = np.linspace(0, 255, 384, dtype=np.uint8)[None, :, None]
+        arr[256:] = rng.integers(0, 256, (256, 384, 3), dtype=np.uint8)
+        src = str(tmp_path / "mixed.tif")
+        Image.fromarray(arr).save(src)
+
+        chunked = str(tmp_path / "chunked.jp2")
+        assert compressor._convert_to_jp2_chunked(
+            src, chunked, DocumentType.PHOTOGRAPH, False, rows_per_chunk=64)
+
+        untiled = str(tmp_path / "untiled.jp2")
+        params = compressor._get_compression_params(
+            DocumentType.PHOTOGRAPH, False, img_size=(384, 512))
+        Image.open(src).save(untiled, format="JPEG2000", **params)
+
+        with open(chunked, "rb") as a, open(untiled, "rb") as b:
+            assert a.read() == b.read()
+
+
+    def test_lossless_tile_height_snapped_to_resolution_grid(
+            self, compressor, photo_tif, tmp_path):
+        out = str(tmp_path / "chunked.jp2")
+        assert compressor._convert_to_jp2_chunked(
+            photo_tif, out, DocumentType.PHOTOGRAPH, True, rows_per_chunk=10)
+        # 10 rows is below one 2**6 grid cell, so the strip grows to 64
+        assert _tile_size(out) == (512, 64)
+        assert np.array_equal(np.array(Image.open(photo_tif)), np.array(Image.open(out)))
+
+    def test_unaligned_tile_height_passes_through(self, photo_tif, tmp_path):
+        compressor = JPEG2000Compressor(num_resolutions=6, align_to_resolution_grid=False)
+        out = str(tmp_path / "chunked.jp2")
+        assert compressor._convert_to_jp2_chunked(
+            photo_tif, out, DocumentType.PHOTOGRAPH, True, rows_per_chunk=10)
+        assert _tile_size(out) == (512, 10)
+        assert np.array_equal(np.array(Image.open(photo_tif)), np.array(Image.open(out)))
+
 
 class Test16BitPreservation:
     def test_16bit_mode_preserved_in_lossy(self, compressor, gray16_tif, tmp_path):
@@ -68,3 +127,53 @@ class TestBnFRatio:
             raw_size = img.size[0] * img.size[1] * len(img.getbands())
         ratio = raw_size / os.path.getsize(out)
         assert 16.0 * 0.95 <= ratio <= 16.0 * 1.05
+
+
+class TestLosslessFallback:
+    @pytest.fixture()
+    def attempts(self, compressor, monkeypatch):
+        """Replace _convert_once with a script of outcomes; record modes."""
+        calls = []
+
+        def script(*outcomes):
+            outcomes = list(outcomes)
+
+            def fake(input_file, output_file, doc_type, mode, *args):
+                calls.append(mode)
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+            monkeypatch.setattr(compressor, "_convert_once", fake)
+            return calls
+        return script
+
+    def convert(self, compressor, photo_tif, tmp_path, **kwargs):
+        return compressor.convert_to_jp2(
+            photo_tif, str(tmp_path / "out.jp2"), DocumentType.PHOTOGRAPH,
+            CompressionMode.SUPERVISED, **kwargs)
+
+    def test_false_then_lossless_success(self, compressor, attempts, photo_tif, tmp_path):
+        calls = attempts(False, True)
+        assert self.convert(compressor, photo_tif, tmp_path)
+        assert calls == [CompressionMode.SUPERVISED, CompressionMode.LOSSLESS]
+
+    def test_error_then_lossless_success(self, compressor, attempts, photo_tif, tmp_path):
+        calls = attempts(ValueError("boom"), True)
+        assert self.convert(compressor, photo_tif, tmp_path)
+        assert len(calls) == 2
+
+    def test_os_error_on_last_attempt_is_raised(self, compressor, attempts, photo_tif, tmp_path):
+        attempts(False, OSError("disk"))
+        with pytest.raises(OSError):
+            self.convert(compressor, photo_tif, tmp_path)
+
+    def test_other_error_on_last_attempt_returns_false(self, compressor, attempts, photo_tif, tmp_path):
+        attempts(False, ValueError("boom"))
+        assert self.convert(compressor, photo_tif, tmp_path) is False
+
+    def test_no_fallback_makes_one_attempt(self, compressor, attempts, photo_tif, tmp_path):
+        calls = attempts(False, True)
+        assert self.convert(compressor, photo_tif, tmp_path, lossless_fallback=False) is False
+        assert calls == [CompressionMode.SUPERVISED]
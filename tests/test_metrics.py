@@ -115,6 +115,31 @@ class TestSSIM:
         a = np.arange(25, dtype=np.uint8).reshape(5, 5)
         assert 0.0 < calculate_ssim(a, a.copy()) <= 1.0
 
+    def test_empty_image_is_nan_like_mse(self):
+        for shape in ((0, 8), (8, 0, 3)):
+            empty = np.zeros(shape, dtype=np.uint8)
+            assert np.isnan(calculate_ssim(empty, empty))
+            assert np.isnan(calculate_mse(empty, empty))
+
     def test_shape_mismatch_raises(self):
         with pytest.raises(ValueError, match="shapes do not match"):
             calculate_ssim(np.zeros((8, 8)), np.zeros((9, 9)))
+
+
+class TestBanding:
+    def test_band_boundaries_do_not_change_results(self, photo_array, monkeypatch):
+        # Metrics are accumulated over row bands; a band height that does
+        # not divide the image must give the same answer as a single band
+        import utils.image as image_utils
+
+        rng = np.random.default_rng(6)
+        noisy = np.clip(
+            photo_array.astype(np.int32) + rng.integers(-8, 9, photo_array.shape),
+            0, 255,
+        ).astype(np.uint8)
+        monkeypatch.setattr(image_utils, "METRIC_BAND_ROWS", 1 << 20)
+        mse_whole = calculate_mse(photo_array, noisy)
+        ssim_whole = calculate_ssim(photo_array, noisy)
+        monkeypatch.setattr(image_utils, "METRIC_BAND_ROWS", 13)
+        assert calculate_mse(photo_array, noisy) == pytest.approx(mse_whole)
+        assert calculate_ssim(photo_array, noisy) == pytest.approx(ssim_whole)
@@ -8,6 +8,7 @@ color space conversions for JPEG2000 images.
 import os
 import logging
 import io
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any, Union
 from PIL import Image, ImageCms
 
@@ -67,6 +68,31 @@ def initialize_profiles():
         GRAY_PROFILE = ImageCms.createProfile("Gray")
 
 
+@lru_cache(maxsize=16)
+def _srgb_transform(profile_data: bytes, in_mode: str, out_mode: str):
+    """
+    Build (once per source profile and mode pair) a transform to sRGB.
+
+    Batches usually share one embedded profile, so parsing it and building
+    the LCMS transform is done once rather than for every image.
+
+    Args:
+        profile_data: Source ICC profile data
+        in_mode: Mode of the source image
+        out_mode: Mode of the converted image
+
+    Returns:
+        ImageCms.ImageCmsTransform: Transform from the source profile to sRGB
+    """
+    initialize_profiles()
+    src_profile = ImageCms.getOpenProfile(io.BytesIO(profile_data))
+    return ImageCms.buildTransform(
+        src_profile, SRGB_PROFILE,
+        in_mode, out_mode,
+        ImageCms.INTENT_RELATIVE_COLORIMETRIC
+    )
+
+
 def get_embedded_icc_profile(image: Image.Image) -> Optional[bytes]:
     """
     Get embedded ICC profile from an image.
@@ -171,11 +197,7 @@ def normalize_colorspace(image: Image.Image) -> Tuple[Image.Image, Optional[byte
                     # Profile is not RGB, convert to sRGB
                     logger.info("Converting non-RGB profile to sRGB")
                     try:
-                        transform = ImageCms.buildTransform(
-                            src_profile, SRGB_PROFILE,
-                            mode, mode,
-                            ImageCms.INTENT_RELATIVE_COLORIMETRIC
-                        )
+                        transform = _srgb_transform(original_profile, mode, mode)
                         converted = ImageCms.applyTransform(image, transform)
                         return converted, get_profile_bytes(SRGB_PROFILE)
                     except Exception as e:
@@ -206,12 +228,7 @@ def normalize_colorspace(image: Image.Image) -> Tuple[Image.Image, Optional[byte
             if original_profile:
                 try:
                     # Try to use embedded profile for conversion
-                    src_profile = ImageCms.getOpenProfile(io.BytesIO(original_profile))
-                    transform = ImageCms.buildTransform(
-                        src_profile, SRGB_PROFILE,
-                        'CMYK', 'RGB',
-                        ImageCms.INTENT_RELATIVE_COLORIMETRIC
-                    )
+                    transform = _srgb_transform(original_profile, 'CMYK', 'RGB')
                     converted = ImageCms.applyTransform(image, transform)
                     return converted, get_profile_bytes(SRGB_PROFILE)
                 except Exception as e:
@@ -12,10 +12,15 @@ import numpy as np
 from PIL import Image
 from PIL.Image import DecompressionBombError
 from functools import lru_cache
-from typing import Tuple, Optional, Dict, Any, List
+from typing import Tuple, Optional, Dict, Any, List, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# File extensions and PIL formats accepted as conversion inputs
+TIFF_EXTENSIONS = ('.tif', '.tiff')
+IMAGE_EXTENSIONS = TIFF_EXTENSIONS + ('.jpg', '.jpeg', '.png')
+SUPPORTED_FORMATS = frozenset({'tiff', 'jpeg', 'png'})
+
 # Add is_multipage_tiff function to detect multi-page TIFFs
 
 
@@ -30,7 +35,7 @@ def is_multipage_tiff(input_file: str) -> Tuple[bool, int]:
         tuple: (is_multipage, page_count)
     """
     try:
-        if not input_file.lower().endswith(('.tif', '.tiff')):
+        if not input_file.lower().endswith(TIFF_EXTENSIONS):
             return False, 1
 
         with Image.open(input_file) as img:
@@ -56,9 +61,9 @@ def extract_tiff_page(input_file: str, page_num: int, output_dir: str) -> str:
         str: Path to extracted page file
     """
     try:
-        # Create temporary directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        # Create temporary directory if it doesn't exist (exist_ok already
+        # covers the common case, no separate exists() probe needed)
+        os.makedirs(output_dir, exist_ok=True)
 
         # Get base filename without extension
         base_name = os.path.splitext(os.path.basename(input_file))[0]
@@ -114,7 +119,7 @@ def validate_image(input_file: str) -> Tuple[bool, str]:
                     return False, "Image dimensions exceed maximum allowed"
 
                 # Check if format is supported
-                if img.format.lower() not in ['tiff', 'jpeg', 'png']:
+                if img.format.lower() not in SUPPORTED_FORMATS:
                     return False, f"Invalid image format: {img.format}"
 
             return True, ""
@@ -226,6 +231,46 @@ def get_multipage_output_paths(input_file: str, output_dir: str, extension: str,
     return output_paths
 
 
+class ImageProbe(NamedTuple):
+    """Header-level facts about an image file."""
+    width: int
+    height: int
+    mode: str
+    num_bands: int
+
+
+@lru_cache(maxsize=128)
+def _probe_image_cached(input_file: str, mtime_ns: int, file_size: int) -> ImageProbe:
+    """
+    Parse an image header, cached on (input_file, mtime_ns, file_size).
+
+    mtime_ns and file_size are not used here; they are part of the cache
+    key only so that a modified file misses the cache and is re-read.
+    """
+    with Image.open(input_file) as img:
+        return ImageProbe(img.width, img.height, img.mode, len(img.getbands()))
+
+
+def probe_image(input_file: str) -> ImageProbe:
+    """
+    Read an image's size and mode, parsing its header once per file version.
+
+    Results are cached by path, modification time and file size, so the
+    several header probes made while converting one file share one parse.
+
+    Args:
+        input_file: Path to input image
+
+    Returns:
+        ImageProbe: Width, height, mode and number of bands
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(input_file)
+    return _probe_image_cached(input_file, st.st_mtime_ns, st.st_size)
+
+
 def should_process_in_chunks(input_file: str, memory_limit_mb: int) -> Tuple[bool, Optional[int]]:
     """
     Determine if an image should be processed in chunks based on size and estimate chunk size.
@@ -238,49 +283,55 @@ def should_process_in_chunks(input_file: str, memory_limit_mb: int) -> Tuple[boo
         tuple: (should_chunk, suggested_chunk_size)
     """
     try:
-        with Image.open(input_file) as img:
-            width, height = img.size
-            num_bands = len(img.getbands())
-
-            # Calculate image size in memory
-            # Each pixel takes num_bands * bytes_per_band (usually 1 for 8-bit depth)
-            # Add 50% overhead for processing
-            bytes_per_band = 1
-            if img.mode in ["I", "F"]:
-                bytes_per_band = 4  # 32-bit integer or float
-            elif img.mode in ["I;16", "I;16L", "I;16B"]:
-                bytes_per_band = 2  # 16-bit
-
-            # Estimate memory usage in MB: width * height * bands * bytes_per_band + 50% overhead
-            estimated_mb = (width * height * num_bands * bytes_per_band * 1.5) / (1024 * 1024)
-
-            logger.debug(f"Image size: {width}x{height}, estimated memory: {estimated_mb:.2f} MB")
-
-            # Determine if we need chunking
-            should_chunk = estimated_mb > memory_limit_mb / 4
-
-            # Calculate suggested chunk size if needed
-            chunk_size = None
-            if should_chunk:
-                # Find a chunk_height that keeps memory usage reasonable
-                # We chunk by rows for simplicity
-                target_chunk_mb = memory_limit_mb / 8  # Use 1/8 of memory limit per chunk
-                bytes_per_row = width * num_bands * bytes_per_band * 1.5
-                rows_per_chunk = int((target_chunk_mb * 1024 * 1024) / bytes_per_row)
-
-                # Ensure at least 10 rows and at most 1/4 of the image
-                rows_per_chunk = max(10, min(rows_per_chunk, height // 4))
-                chunk_size = rows_per_chunk
-
-                logger.debug(f"Will process in chunks of {rows_per_chunk} rows")
-
-            return should_chunk, chunk_size
+        width, height, mode, num_bands = probe_image(input_file)
+
+        # Calculate image size in memory
+        # Each pixel takes num_bands * bytes_per_band (usually 1 for 8-bit depth)
+        # Add 50% overhead for processing
+        bytes_per_band = 1
+        if mode in ["I", "F"]:
+            bytes_per_band = 4  # 32-bit integer or float
+        elif mode in ["I;16", "I;16L", "I;16B"]:
+            bytes_per_band = 2  # 16-bit
+
+        # Estimate memory usage in MB: width * height * bands * bytes_per_band + 50% overhead
+        estimated_mb = (width * height * num_bands * bytes_per_band * 1.5) / (1024 * 1024)
+
+        logger.debug(f"Image size: {width}x{height}, estimated memory: {estimated_mb:.2f} MB")
+
+        # Determine if we need chunking
+        should_chunk = estimated_mb > memory_limit_mb / 4
+
+        # Calculate suggested chunk size if needed
+        chunk_size = None
+        if should_chunk:
+            # Find a chunk_height that keeps memory usage reasonable
+            # We chunk by rows for simplicity
+            target_chunk_mb = memory_limit_mb / 8  # Use 1/8 of memory limit per chunk
+            bytes_per_row = width * num_bands * bytes_per_band * 1.5
+            rows_per_chunk = int((target_chunk_mb * 1024 * 1024) / bytes_per_row)
+
+            # Ensure at least 10 rows and at most 1/4 of the image
+            rows_per_chunk = max(10, min(rows_per_chunk, height // 4))
+            chunk_size = rows_per_chunk
+
+            logger.debug(f"Will process in chunks of {rows_per_chunk} rows")
+
+        return should_chunk, chunk_size
     except Exception as e:
         logger.warning(f"Error determining chunk size for {input_file}: {str(e)}")
         # If we can't determine, err on the side of caution and use default chunk size
         return True, None
 
 
+# Rows of image data converted to float64 at a time by the quality metrics;
+# bounds the temporaries to a band instead of several full-image copies
+METRIC_BAND_ROWS = 512
+
+# Side of the sliding SSIM window, in pixels
+SSIM_WIN_SIZE = 7
+
+
 def peak_signal_value(array: np.ndarray) -> float:
     """
     Determine the peak signal value for an image array based on its dtype.
@@ -315,10 +366,32 @@ def calculate_mse(orig_array: np.ndarray, conv_array: np.ndarray) -> float:
     if orig_array.shape != conv_array.shape:
         raise ValueError(
             f"Image shapes do not match: {orig_array.shape} vs {conv_array.shape}")
-    # Cast to float64 before subtracting: integer arrays (uint8/uint16)
-    # wrap around on subtraction and squaring, corrupting the metric
-    diff = orig_array.astype(np.float64) - conv_array.astype(np.float64)
-    return float(np.mean(diff ** 2))
+    if orig_array.size == 0:
+        return float('nan')
+
+    # Widen before subtracting: uint8/uint16 arrays wrap around on
+    # subtraction and squaring, corrupting the metric. 8- and 16-bit
+    # integer images are handled exactly in int32/int64 (a fraction of the
+    # bytes of float64); anything else falls back to float64. Work in row
+    # bands so the temporaries stay band-sized.
+    if (np.issubdtype(orig_array.dtype, np.integer)
+            and np.issubdtype(conv_array.dtype, np.integer)
+            and max(orig_array.dtype.itemsize, conv_array.dtype.itemsize) <= 2):
+        # Squares of 8-bit differences fit in int32; 16-bit ones need int64
+        work_dtype = np.int32 if max(orig_array.dtype.itemsize, conv_array.dtype.itemsize) == 1 else np.int64
+        sum_sq = 0
+        for start in range(0, orig_array.shape[0], METRIC_BAND_ROWS):
+            stop = start + METRIC_BAND_ROWS
+            diff = orig_array[start:stop].astype(work_dtype) - conv_array[start:stop].astype(work_dtype)
+            sum_sq += int(np.sum(diff * diff, dtype=np.int64))
+        return sum_sq / orig_array.size
+
+    sum_sq = 0.0
+    for start in range(0, orig_array.shape[0], METRIC_BAND_ROWS):
+        stop = start + METRIC_BAND_ROWS
+        diff = orig_array[start:stop].astype(np.float64) - conv_array[start:stop].astype(np.float64)
+        sum_sq += float(np.sum(diff ** 2))
+    return sum_sq / orig_array.size
 
 
 def calculate_psnr(mse: float, max_pixel: float = 255.0) -> float:
@@ -350,19 +423,24 @@ def _window_means(array: np.ndarray, size: int) -> np.ndarray:
     Returns:
         np.ndarray: Array of window means
     """
-    integral = np.cumsum(np.cumsum(array, axis=0, dtype=np.float64), axis=1)
-    integral = np.pad(integral, ((1, 0), (1, 0)), mode='constant')
-    window_sums = (
-        integral[size:, size:] - integral[:-size, size:]
-        - integral[size:, :-size] + integral[:-size, :-size]
-    )
-    return window_sums / (size * size)
+    # Build the zero-padded integral image in place rather than through
+    # cumsum/cumsum/pad temporaries
+    rows, cols = array.shape
+    integral = np.zeros((rows + 1, cols + 1), dtype=np.float64)
+    np.cumsum(array, axis=0, dtype=np.float64, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+
+    window_sums = integral[size:, size:] - integral[:-size, size:]
+    window_sums -= integral[size:, :-size]
+    window_sums += integral[:-size, :-size]
+    window_sums /= size * size
+    return window_sums
 
 
 def calculate_ssim(
     orig_array: np.ndarray,
     conv_array: np.ndarray,
-    win_size: int = 7
+    win_size: int = SSIM_WIN_SIZE
 ) -> float:
     """
     Calculate the Structural Similarity Index (Wang et al. 2004).
@@ -386,15 +464,16 @@ def calculate_ssim(
     if orig_array.shape != conv_array.shape:
         raise ValueError(
             f"Image shapes do not match: {orig_array.shape} vs {conv_array.shape}")
+    if orig_array.size == 0:
+        return float('nan')
 
     data_range = peak_signal_value(orig_array)
     c1 = (0.01 * data_range) ** 2
     c2 = (0.03 * data_range) ** 2
 
-    orig = orig_array.astype(np.float64)
-    conv = conv_array.astype(np.float64)
-
-    # Treat 2D images as single-channel
+    # Treat 2D images as single-channel (views, no copy)
+    orig = orig_array
+    conv = conv_array
     if orig.ndim == 2:
         orig = orig[:, :, np.newaxis]
         conv = conv[:, :, np.newaxis]
@@ -410,26 +489,59 @@ def calculate_ssim(
     # Sample covariance normalization, as used by scikit-image
     cov_norm = n_pixels / (n_pixels - 1) if n_pixels > 1 else 1.0
 
+    # Number of valid window positions along each axis
+    out_rows = orig.shape[0] - win_size + 1
+    out_cols = orig.shape[1] - win_size + 1
+
     channel_ssims = []
     for ch in range(orig.shape[2]):
-        x = orig[:, :, ch]
-        y = conv[:, :, ch]
-
-        ux = _window_means(x, win_size)
-        uy = _window_means(y, win_size)
-        uxx = _window_means(x * x, win_size)
-        uyy = _window_means(y * y, win_size)
-        uxy = _window_means(x * y, win_size)
-
-        vx = cov_norm * (uxx - ux * ux)
-        vy = cov_norm * (uyy - uy * uy)
-        vxy = cov_norm * (uxy - ux * uy)
-
-        ssim_map = (
-            ((2 * ux * uy + c1) * (2 * vxy + c2)) /
-            ((ux ** 2 + uy ** 2 + c1) * (vx + vy + c2))
-        )
-        channel_ssims.append(np.mean(ssim_map))
+        # Process METRIC_BAND_ROWS window rows at a time; each input band
+        # overlaps the next by win_size - 1 rows so every window is covered
+        # exactly once
+        ssim_sum = 0.0
+        for start in range(0, out_rows, METRIC_BAND_ROWS):
+            stop = min(start + METRIC_BAND_ROWS, out_rows) + win_size - 1
+            x = orig[start:stop, :, ch].astype(np.float64)
+            y = conv[start:stop, :, ch].astype(np.float64)
+
+            ux = _window_means(x, win_size)
+            uy = _window_means(y, win_size)
+            # One scratch buffer for the x*x, y*y and x*y products
+            product = np.multiply(x, x)
+            uxx = _window_means(product, win_size)
+            np.multiply(y, y, out=product)
+            uyy = _window_means(product, win_size)
+            np.multiply(x, y, out=product)
+            uxy = _window_means(product, win_size)
+            del x, y, product
+
+            # Evaluate
+            #   ((2*ux*uy + c1) * (2*vxy + c2)) /
+            #   ((ux^2 + uy^2 + c1) * (vx + vy + c2))
+            # in place, reusing the window-mean buffers instead of
+            # allocating a temporary per operator
+            numerator = ux * uy
+            uxy -= numerator
+            uxy *= 2 * cov_norm
+            uxy += c2                   # 2*vxy + c2
+            numerator *= 2
+            numerator += c1
+            numerator *= uxy
+
+            np.square(ux, out=ux)
+            np.square(uy, out=uy)
+            uxx -= ux
+            uyy -= uy
+            uxx += uyy
+            uxx *= cov_norm
+            uxx += c2                   # vx + vy + c2
+            ux += uy
+            ux += c1
+            ux *= uxx                   # denominator
+
+            numerator /= ux
+            ssim_sum += float(np.sum(numerator))
+        channel_ssims.append(ssim_sum / (out_rows * out_cols))
 
     return float(np.mean(channel_ssims))
 
@@ -462,12 +574,22 @@ def find_image_files(directory: str, recursive: bool = False) -> list:
         list: List of image file paths
     """
     image_files = []
-    for root, _, files in os.walk(directory):
-        if not recursive and root != directory:
-            continue
 
+    if not recursive:
+        # Single directory read; DirEntry carries the file type from
+        # getdents, so no per-entry stat() and no walk of subdirectories
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(IMAGE_EXTENSIONS) and not entry.is_dir():
+                        image_files.append(os.path.join(directory, entry.name))
+        except OSError as e:
+            logger.warning(f"Error listing directory {directory}: {str(e)}")
+        return image_files
+
+    for root, _, files in os.walk(directory):
         for file in files:
-            if file.lower().endswith(('.tif', '.tiff', '.jpg', '.jpeg', '.png')):
+            if file.lower().endswith(IMAGE_EXTENSIONS):
                 image_files.append(os.path.join(root, file))
 
     return image_files
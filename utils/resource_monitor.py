@@ -10,8 +10,8 @@ import os
 import time
 import logging
 import threading
-import platform
 import multiprocessing
+from functools import lru_cache
 import psutil
 from typing import Callable, Dict, Any, Optional, List
 
@@ -133,8 +133,9 @@ class ResourceMonitor:
         """Check resource usage and adjust worker count if needed."""
         # Get current resource usage
         cpu_usage = psutil.cpu_percent(interval=None) / 100.0
-        memory_usage = psutil.virtual_memory().percent / 100.0
-        used_memory_mb = psutil.virtual_memory().used / (1024 * 1024)
+        memory = psutil.virtual_memory()
+        memory_usage = memory.percent / 100.0
+        used_memory_mb = memory.used / (1024 * 1024)
 
         # Calculate how close we are to the limits
         cpu_headroom = max(0, self.cpu_threshold - cpu_usage) / self.cpu_threshold
@@ -177,6 +178,22 @@ class ResourceMonitor:
             )
 
 
+@lru_cache(maxsize=1)
+def _platform_info() -> tuple:
+    """
+    Get the platform string and Python version.
+
+    These never change for the lifetime of the process, and
+    platform.platform() may shell out to uname, so the result is cached.
+
+    Returns:
+        tuple: (platform string, Python version)
+    """
+    import platform
+
+    return platform.platform(), platform.python_version()
+
+
 def get_system_info() -> Dict[str, Any]:
     """
     Get system information including CPU, memory, and OS details.
@@ -184,14 +201,16 @@ def get_system_info() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: System information
     """
+    platform_name, python_version = _platform_info()
+    memory = psutil.virtual_memory()
     return {
-        "platform": platform.platform(),
-        "python_version": platform.python_version(),
+        "platform": platform_name,
+        "python_version": python_version,
         "cpu_count": multiprocessing.cpu_count(),
         "cpu_freq": psutil.cpu_freq() if hasattr(psutil, "cpu_freq") else None,
-        "total_memory_mb": psutil.virtual_memory().total / (1024 * 1024),
-        "available_memory_mb": psutil.virtual_memory().available / (1024 * 1024),
-        "memory_percent": psutil.virtual_memory().percent,
+        "total_memory_mb": memory.total / (1024 * 1024),
+        "available_memory_mb": memory.available / (1024 * 1024),
+        "memory_percent": memory.percent,
     }
 
 
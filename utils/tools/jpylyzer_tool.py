@@ -8,6 +8,7 @@ properties from JP2 files.
 import os
 import logging
 import subprocess
+from importlib import metadata
 from typing import Dict, Any, Optional, List, Union, Tuple
 
 try:
@@ -54,6 +55,10 @@ class JPylyzerTool:
         self.timeout = timeout
         self.format_type = format_type
 
+        # Executable availability and version, probed once on first use
+        self._available = None
+        self._version = None
+
         # If no path provided, try to find jpylyzer on PATH
         if self.jpylyzer_path is None:
             import shutil
@@ -70,6 +75,7 @@ class JPylyzerTool:
             try:
                 import jpylyzer
                 self.use_module = True
+                self._version = self._module_version(jpylyzer)
                 logger.info("Using JPylyzer as a Python module")
             except ImportError:
                 logger.warning("JPylyzer not found as executable or module")
@@ -80,6 +86,9 @@ class JPylyzerTool:
         """
         Check if JPylyzer is available.
 
+        The executable is probed only once; the result is cached for the
+        lifetime of this instance.
+
         Returns:
             bool: True if JPylyzer is available, False otherwise
         """
@@ -89,6 +98,16 @@ class JPylyzerTool:
         if self.jpylyzer_path is None:
             return False
 
+        if self._available is None:
+            self._probe_executable()
+
+        return self._available
+
+    def _probe_executable(self) -> None:
+        """
+        Run ``jpylyzer --version`` once and cache availability and version.
+        """
+        self._available = False
         try:
             result = subprocess.run(
                 [self.jpylyzer_path, "--version"],
@@ -99,10 +118,30 @@ class JPylyzerTool:
                 check=False
             )
 
-            return result.returncode == 0
+            if result.returncode == 0:
+                self._available = True
+                self._version = result.stdout.strip()
         except Exception as e:
             logger.warning(f"Error checking JPylyzer availability: {e}")
-            return False
+
+    @staticmethod
+    def _module_version(module) -> str:
+        """
+        Look up the version of the imported jpylyzer module.
+
+        Args:
+            module: The imported jpylyzer module
+
+        Returns:
+            str: Module version, or 'Unknown' if it cannot be determined
+        """
+        version = getattr(module, '__version__', None)
+        if version:
+            return version
+        try:
+            return metadata.version('jpylyzer')
+        except metadata.PackageNotFoundError:
+            return 'Unknown'
 
     def get_version(self) -> Optional[str]:
         """
@@ -112,33 +151,12 @@ class JPylyzerTool:
             Optional[str]: JPylyzer version or None if not available
         """
         if self.use_module:
-            try:
-                import jpylyzer
-                return getattr(jpylyzer, '__version__', 'Unknown')
-            except ImportError:
-                return None
+            return self._version
 
         if not self.is_available():
             return None
 
-        try:
-            result = subprocess.run(
-                [self.jpylyzer_path, "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=self.timeout,
-                check=False
-            )
-
-            if result.returncode == 0:
-                # Extract version number from output
-                version_line = result.stdout.strip()
-                return version_line
-            return None
-        except Exception as e:
-            logger.warning(f"Error getting JPylyzer version: {e}")
-            return None
+        return self._version
 
     def validate(self, jp2_file: str) -> Dict[str, Any]:
         """
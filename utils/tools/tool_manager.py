@@ -9,10 +9,39 @@ import os
 import logging
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
 from typing import Dict, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Per-tool probe details: display name, version arguments and common
+# installation locations checked when the tool is not on PATH
+_TOOL_SPECS = {
+    'exiftool': {
+        'label': 'ExifTool',
+        'version_args': ['-ver'],
+        'common_paths': [
+            '/usr/bin/exiftool',
+            '/usr/local/bin/exiftool',
+            '/opt/homebrew/bin/exiftool',
+            'C:\\Program Files\\ExifTool\\exiftool.exe',
+            'C:\\Program Files (x86)\\ExifTool\\exiftool.exe'
+        ],
+    },
+    'jpylyzer': {
+        'label': 'jpylyzer',
+        'version_args': ['--version'],
+        'common_paths': [
+            '/usr/bin/jpylyzer',
+            '/usr/local/bin/jpylyzer',
+            '/opt/homebrew/bin/jpylyzer',
+            'C:\\Program Files\\jpylyzer\\jpylyzer.exe',
+            'C:\\Program Files (x86)\\jpylyzer\\jpylyzer.exe'
+        ],
+    },
+}
+
 
 class ToolManager:
     """
@@ -60,9 +89,13 @@ class ToolManager:
         self._available_tools = {}
         self._tool_versions = {}
 
-        # Detect common tools
-        self._detect_exiftool()
-        self._detect_jpylyzer()
+        # Detect common tools concurrently; each detector waits on its own
+        # verification subprocess, so the probes overlap instead of adding up
+        detectors = (self._detect_exiftool, self._detect_jpylyzer)
+        with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+            futures = [executor.submit(detector) for detector in detectors]
+            for future in futures:
+                future.result()
 
         logger.info(
             f"Detected {len(self._available_tools)} available tools: "
@@ -78,7 +111,7 @@ class ToolManager:
 
         if exiftool_path and os.path.exists(exiftool_path):
             # Verify it works
-            if self._verify_exiftool(exiftool_path):
+            if self._verify_tool('exiftool', exiftool_path):
                 self._available_tools['exiftool'] = exiftool_path
                 return
 
@@ -86,63 +119,15 @@ class ToolManager:
         if self.prefer_system_tools:
             exiftool_path = shutil.which('exiftool')
             if exiftool_path:
-                if self._verify_exiftool(exiftool_path):
+                if self._verify_tool('exiftool', exiftool_path):
                     self._available_tools['exiftool'] = exiftool_path
                     return
 
-        # Check common installation locations
-        common_paths = [
-            '/usr/bin/exiftool',
-            '/usr/local/bin/exiftool',
-            '/opt/homebrew/bin/exiftool',
-            'C:\\Program Files\\ExifTool\\exiftool.exe',
-            'C:\\Program Files (x86)\\ExifTool\\exiftool.exe'
-        ]
-
-        for path in common_paths:
-            if os.path.exists(path):
-                if self._verify_exiftool(path):
-                    self._available_tools['exiftool'] = path
-                    return
+        if self._detect_in_common_paths('exiftool'):
+            return
 
         logger.warning("ExifTool not found, metadata operations may fail")
 
-    def _verify_exiftool(self, path: str) -> bool:
-        """
-        Verify that the ExifTool at the given path works.
-
-        Args:
-            path: Path to ExifTool
-
-        Returns:
-            bool: True if ExifTool works
-        """
-        try:
-            result = subprocess.run(
-                [path, '-ver'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=self.timeout,
-                check=False
-            )
-
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                logger.info(f"Found ExifTool {version} at {path}")
-                self._tool_versions['exiftool'] = version
-                return True
-            else:
-                logger.warning(
-                    f"ExifTool at {path} failed verification: "
-                    f"{result.stderr.strip()}"
-                )
-                return False
-
-        except Exception as e:
-            logger.warning(f"Error verifying ExifTool at {path}: {e}")
-            return False
-
     def _detect_jpylyzer(self) -> None:
         """
         Detect jpylyzer availability.
@@ -151,48 +136,54 @@ class ToolManager:
         if self.prefer_system_tools:
             jpylyzer_path = shutil.which('jpylyzer')
             if jpylyzer_path:
-                if self._verify_jpylyzer(jpylyzer_path):
+                if self._verify_tool('jpylyzer', jpylyzer_path):
                     self._available_tools['jpylyzer'] = jpylyzer_path
                     return
 
-        # Check Python modules
+        # Check Python modules via installed package metadata (no import)
         try:
-            import jpylyzer
+            self._tool_versions['jpylyzer'] = metadata.version('jpylyzer')
             self._available_tools['jpylyzer_module'] = 'jpylyzer'
-            self._tool_versions['jpylyzer'] = getattr(jpylyzer, '__version__', 'Unknown')
             logger.info(f"Found jpylyzer module version {self._tool_versions['jpylyzer']}")
             return
-        except ImportError:
+        except metadata.PackageNotFoundError:
             pass
 
-        # Check common installation locations
-        common_paths = [
-            '/usr/bin/jpylyzer',
-            '/usr/local/bin/jpylyzer',
-            '/opt/homebrew/bin/jpylyzer',
-            'C:\\Program Files\\jpylyzer\\jpylyzer.exe',
-            'C:\\Program Files (x86)\\jpylyzer\\jpylyzer.exe'
-        ]
+        self._detect_in_common_paths('jpylyzer')
 
-        for path in common_paths:
+    def _detect_in_common_paths(self, tool: str) -> bool:
+        """
+        Look for a tool in its common installation locations.
+
+        Args:
+            tool: Tool name (key of _TOOL_SPECS)
+
+        Returns:
+            bool: True if a working executable was found and registered
+        """
+        for path in _TOOL_SPECS[tool]['common_paths']:
             if os.path.exists(path):
-                if self._verify_jpylyzer(path):
-                    self._available_tools['jpylyzer'] = path
-                    return
+                if self._verify_tool(tool, path):
+                    self._available_tools[tool] = path
+                    return True
+        return False
 
-    def _verify_jpylyzer(self, path: str) -> bool:
+    def _verify_tool(self, tool: str, path: str) -> bool:
         """
-        Verify that jpylyzer at the given path works.
+        Verify that the tool at the given path works and record its version.
 
         Args:
-            path: Path to jpylyzer
+            tool: Tool name (key of _TOOL_SPECS)
+            path: Path to the tool executable
 
         Returns:
-            bool: True if jpylyzer works
+            bool: True if the tool works
         """
+        spec = _TOOL_SPECS[tool]
+        label = spec['label']
         try:
             result = subprocess.run(
-                [path, '--version'],
+                [path, *spec['version_args']],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -202,18 +193,18 @@ class ToolManager:
 
             if result.returncode == 0:
                 version = result.stdout.strip()
-                logger.info(f"Found jpylyzer {version} at {path}")
-                self._tool_versions['jpylyzer'] = version
+                logger.info(f"Found {label} {version} at {path}")
+                self._tool_versions[tool] = version
                 return True
             else:
                 logger.warning(
-                    f"jpylyzer at {path} failed verification: "
+                    f"{label} at {path} failed verification: "
                     f"{result.stderr.strip()}"
                 )
                 return False
 
         except Exception as e:
-            logger.warning(f"Error verifying jpylyzer at {path}: {e}")
+            logger.warning(f"Error verifying {label} at {path}: {e}")
             return False
 
     def is_available(self, tool: str) -> bool:
@@ -56,7 +56,8 @@ class BaseWorkflow(ABC):
             psnr_threshold=config.quality_threshold,
             ssim_threshold=0.95,
             mse_threshold=50.0,
-            report_dir=config.report_dir
+            report_dir=config.report_dir,
+            max_dim=config.analysis_max_dim
         )
 
         # Initialize metadata handler based on BnF compliance
@@ -242,25 +243,6 @@ class BaseWorkflow(ABC):
         # Implementation provided by subclasses
         pass
 
-    def _format_file_size(self, size_in_bytes: int) -> str:
-        """Format file size in human-readable format.
-
-        Args:
-            size_in_bytes: File size in bytes
-
-        Returns:
-            str: Human-readable file size
-        """
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        size = float(size_in_bytes)
-        unit_index = 0
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        return f"{size:.2f} {units[unit_index]}"
-
     def _generate_summary_report(self, results: Dict[str, Any]) -> str:
         """Generate a summary report of the processing results.
 
@@ -6,7 +6,6 @@ using multiprocessing for improved performance.
 """
 
 import os
-import gc
 import time
 import logging
 import multiprocessing
@@ -51,7 +50,8 @@ def standalone_process_file_worker(
     include_bnf_markers: bool,
     metadata: Optional[Dict[str, Any]] = None,
     memory_limit_mb: int = 4096,
-    chunk_size: int = 1000000
+    chunk_size: int = 1000000,
+    analysis_max_dim: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Process a single file without requiring class instance state.
@@ -71,6 +71,9 @@ def standalone_process_file_worker(
         compression_ratio_tolerance: Tolerance for compression ratio
         include_bnf_markers: Whether to include BnF robustness markers
         metadata: Additional metadata to include in output file
+        memory_limit_mb: Memory limit in MB for adaptive processing
+        chunk_size: Number of pixels to process at once for large images
+        analysis_max_dim: Longest side for quality analysis (None: full size)
 
     Returns:
         dict: Processing result as a dictionary
@@ -93,7 +96,8 @@ def standalone_process_file_worker(
             compression_ratio_tolerance=compression_ratio_tolerance,
             include_bnf_markers=include_bnf_markers,
             memory_limit_mb=memory_limit_mb,
-            chunk_size=chunk_size
+            chunk_size=chunk_size,
+            analysis_max_dim=analysis_max_dim
         )
 
         # Create a fresh workflow instance specific to this worker
@@ -234,7 +238,8 @@ class ParallelWorkflow(BaseWorkflow):
             include_bnf_markers=include_bnf_markers,
             metadata=metadata,
             memory_limit_mb=self.config.memory_limit_mb,
-            chunk_size=self.config.chunk_size
+            chunk_size=self.config.chunk_size,
+            analysis_max_dim=self.config.analysis_max_dim
         )
 
     def _update_result_status(self, results, file_result):
@@ -684,7 +689,8 @@ class ParallelWorkflow(BaseWorkflow):
             bnf_compliant=bnf_compliant,
             compression_ratio_tolerance=compression_ratio_tolerance,
             include_bnf_markers=include_bnf_markers,
-            metadata=metadata
+            metadata=metadata,
+            analysis_max_dim=self.config.analysis_max_dim
         )
 
         # Start the resource monitor
@@ -741,9 +747,6 @@ class ParallelWorkflow(BaseWorkflow):
                         else:
                             logger.info(
                                 f"Progress: {progress:.1f}% ({processed_count}/{self.total_files})")
-                        
-                        # Force garbage collection to optimize memory usage
-                        gc.collect()
 
                         # Log status periodically
                         self._log_progress(processed_count, self.total_files, self.start_time, current_workers)
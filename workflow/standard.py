@@ -5,7 +5,6 @@ This module provides a sequential implementation of the JPEG2000 workflow.
 """
 
 import os
-import gc
 import time
 import logging
 import tempfile
@@ -198,11 +197,16 @@ class StandardWorkflow(BaseWorkflow):
 
     def _cleanup_temp_files(self):
         """Remove temporary files created for multi-page TIFF processing."""
+        if not hasattr(self, 'temp_dir'):
+            return
         try:
             import shutil
-            if hasattr(self, 'temp_dir') and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                logger.debug(f"Removed temporary directory: {self.temp_dir}")
+            # Let rmtree's own directory scan detect a missing path rather
+            # than stat()ing it up front
+            shutil.rmtree(self.temp_dir)
+            logger.debug(f"Removed temporary directory: {self.temp_dir}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Failed to clean up temporary files: {str(e)}")
 
@@ -386,10 +390,6 @@ class StandardWorkflow(BaseWorkflow):
                     except Exception as e:
                         return self._handle_metadata_error(e, input_file, output_file, "standard")
 
-            # Force garbage collection
-            with profile_block("cleanup"):
-                gc.collect()
-
             # Calculate file sizes and log compression stats
             file_sizes = None
             try:
@@ -700,16 +700,14 @@ class StandardWorkflow(BaseWorkflow):
                     "error": str(e)
                 })
 
-            # Force garbage collection after each page
-            gc.collect()
-
             # Don't clean up temporary files if keep_temp is enabled
             if hasattr(self.config, 'keep_temp') and self.config.keep_temp:
                 logger.info(f"Keeping temporary file for page {page_num+1}: {temp_tiff}")
             else:
                 try:
-                    if os.path.exists(temp_tiff):
-                        os.remove(temp_tiff)
+                    os.remove(temp_tiff)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     logger.warning(f"Failed to remove temporary file {temp_tiff}: {str(e)}")
 
@@ -871,9 +869,6 @@ class StandardWorkflow(BaseWorkflow):
 
             # Update progress with time estimation
             self._log_progress_with_estimation(len(results['processed_files']), self.total_files, self.start_time)
-            
-            # Force garbage collection to optimize memory usage
-            gc.collect()
 
             # If there are errors, we still continue processing other files
 